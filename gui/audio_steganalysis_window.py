@@ -1,81 +1,185 @@
 # gui/audio_steganalysis_window.py
+import functools
+import os
+from collections import OrderedDict
+from types import MappingProxyType
+
 import numpy as np
-import wave
-import matplotlib.pyplot as plt
-import io
+import scipy.fft
 from PyQt6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QLabel, QPushButton, 
                              QFrame, QFileDialog, QTextEdit, QGroupBox, QGridLayout, 
                              QLineEdit, QComboBox, QSizePolicy)
-from PyQt6.QtCore import Qt
-from PyQt6.QtGui import QFont, QPixmap
-from matplotlib.backends.backend_qtagg import FigureCanvasQTAgg as FigureCanvas
-from matplotlib.figure import Figure
+from PyQt6.QtCore import Qt, QThreadPool, QPointF
+from PyQt6.QtGui import QFont, QPixmap, QImage, QPainter, QPen, QColor, QPolygonF
+
+from gui.workers import AnalysisWorker
+
+
+@functools.lru_cache(maxsize=None)
+def hann_window(nfft: int) -> np.ndarray:
+    """Return a read-only float32 Hann window, built once per length"""
+    window = np.hanning(nfft).astype(np.float32)
+    window.flags.writeable = False
+    return window
 
 
 class AudioSteganalysisWindow(QWidget):
+    # Shared, read-only method help text shown under the method combo
+    METHOD_DESCRIPTIONS = MappingProxyType({
+        "Audio LSB Analysis": "Analyzes least significant bits in audio samples to detect hidden data embedded in audio files.",
+        "Audio Chi-Square Test": "Statistical analysis of audio sample distributions to identify anomalies that may indicate steganographic content.",
+        "Audio Spectral Analysis": "Examines frequency domain characteristics and power spectral density to detect audio steganography.",
+        "Audio Autocorrelation Analysis": "Analyzes temporal patterns and periodic structures in audio to detect hidden information.",
+        "Audio Entropy Analysis": "Measures randomness and information content in audio samples to identify steganographic artifacts.",
+        "Audio Comprehensive Analysis": "Combines multiple audio detection methods for thorough analysis of potential hidden content.",
+        "Audio Advanced Comprehensive": "Uses all available audio analysis techniques for the most comprehensive steganalysis possible."
+    })
+
+    # Number of browse previews kept in memory
+    PREVIEW_CACHE_SIZE = 16
+
+    # Frames decoded per read while building the browse preview's envelope
+    PREVIEW_BLOCK_FRAMES = 1 << 20
+
+    # Min/max buckets drawn on the waveform chart (two vertices each)
+    WAVE_CHART_POINTS = 4000
+
     def __init__(self, machine):
         super().__init__()
         self.machine = machine
         self.main_gui = None  # Will be set by main window
+        self._worker = None
+        self._preview_worker = None
+        # Small LRU of rendered previews keyed by (path, mtime)
+        self._preview_cache = OrderedDict()
+        self._preview_key = None
         
     def set_main_gui(self, main_gui):
         """Set reference to main GUI for accessing widgets"""
         self.main_gui = main_gui
-        self.method_descriptions = {
-            "Audio LSB Analysis": "Analyzes least significant bits in audio samples to detect hidden data embedded in audio files.",
-            "Audio Chi-Square Test": "Statistical analysis of audio sample distributions to identify anomalies that may indicate steganographic content.",
-            "Audio Spectral Analysis": "Examines frequency domain characteristics and power spectral density to detect audio steganography.",
-            "Audio Autocorrelation Analysis": "Analyzes temporal patterns and periodic structures in audio to detect hidden information.",
-            "Audio Entropy Analysis": "Measures randomness and information content in audio samples to identify steganographic artifacts.",
-            "Audio Comprehensive Analysis": "Combines multiple audio detection methods for thorough analysis of potential hidden content.",
-            "Audio Advanced Comprehensive": "Uses all available audio analysis techniques for the most comprehensive steganalysis possible."
-        }
 
     def create_audio_preview(self, audio_path: str):
-        """Create a waveform preview of the selected audio"""
+        """Create a waveform preview of the selected audio (rendered on a worker thread)"""
         try:
-            # Read WAV file
-            with wave.open(audio_path, "rb") as wf:
-                n_channels = wf.getnchannels()
-                n_frames = wf.getnframes()
-                sample_width = wf.getsampwidth()
-                framerate = wf.getframerate()
-                duration = n_frames / float(framerate)
-
-                # Extract raw audio
-                frames = wf.readframes(n_frames)
-                audio_data = np.frombuffer(frames, dtype=np.int16)
-
-                if n_channels > 1:
-                    audio_data = audio_data[::n_channels]  # take left channel if stereo
-
-            # Plot waveform (downsample if too large)
-            max_points = 1000
-            if len(audio_data) > max_points:
-                factor = len(audio_data) // max_points
-                audio_data = audio_data[::factor]
-
-            plt.figure(figsize=(4, 2))
-            plt.plot(audio_data, color="blue")
-            plt.axis("off")
-            plt.tight_layout()
-
-            # Save plot to QPixmap
-            buf = io.BytesIO()
-            plt.savefig(buf, format="png")
-            buf.seek(0)
-            plt.close()
-
-            pixmap = QPixmap()
-            pixmap.loadFromData(buf.getvalue())
-
-            # Set to QLabel
-            self.main_gui.audio_preview.setPixmap(pixmap)
-            self.main_gui.audio_preview.setText("")
+            # Re-browsing an unchanged file reuses the pixmap rendered last time
+            key = (audio_path, os.path.getmtime(audio_path))
+            self._preview_key = key
+            pixmap = self._preview_cache.get(key)
+            if pixmap is not None:
+                self._preview_cache.move_to_end(key)
+                self._show_audio_preview(pixmap)
+                return
+
+            self.main_gui.audio_preview.setText("Loading preview...")
+            self._preview_worker = AnalysisWorker(self._load_waveform_preview, audio_path)
+            self._preview_worker.signals.finished.connect(
+                lambda image, key=key: self._on_audio_preview_ready(key, image))
+            self._preview_worker.signals.error.connect(
+                lambda message, key=key: self._on_audio_preview_error(key, message))
+            QThreadPool.globalInstance().start(self._preview_worker)
 
         except Exception as e:
             self.main_gui.audio_preview.setText(f"Error loading audio preview: {str(e)}")
 
+    def _on_audio_preview_ready(self, key, image: QImage):
+        # Ignore a slower preview of a file the user has already browsed away from
+        if key != self._preview_key:
+            return
+        pixmap = QPixmap.fromImage(image)
+        self._preview_cache[key] = pixmap
+        if len(self._preview_cache) > self.PREVIEW_CACHE_SIZE:
+            self._preview_cache.popitem(last=False)
+        self._show_audio_preview(pixmap)
+
+    def _on_audio_preview_error(self, key, message: str):
+        if key == self._preview_key:
+            self.main_gui.audio_preview.setText(f"Error loading audio preview: {message}")
+
+    def _show_audio_preview(self, pixmap: QPixmap):
+        self.main_gui.audio_preview.setPixmap(pixmap)
+        self.main_gui.audio_preview.setText("")
+
+    @classmethod
+    def _load_waveform_preview(cls, audio_path: str) -> QImage:
+        """Read and decimate a WAV file, then draw its waveform (no widget access)"""
+        lows, highs = cls._read_waveform_envelope(audio_path, 1000)
+        return cls._render_waveform_image(lows, highs, 400, 200)
+
+    @classmethod
+    def _read_waveform_envelope(cls, audio_path: str, max_points: int):
+        """Min/max envelope of a file's first channel, decoded a block of buckets at a time"""
+        # libsndfile decodes straight to int16 (any PCM width); reading whole
+        # buckets per block keeps peak memory at one block instead of the file
+        import soundfile as sf
+
+        with sf.SoundFile(audio_path) as f:
+            factor = f.frames // max_points
+            if factor <= 1:
+                samples = f.read(dtype='int16', always_2d=True)[:, 0]
+                return samples, samples
+
+            per_read = max(1, cls.PREVIEW_BLOCK_FRAMES // factor)
+            lows, highs = [], []
+            for start in range(0, max_points, per_read):
+                block = f.read(min(per_read, max_points - start) * factor,
+                               dtype='int16', always_2d=True)[:, 0]
+                # A truncated file ends early; drop its partial bucket
+                count = len(block) // factor
+                if count == 0:
+                    break
+                low, high = cls._waveform_envelope(block[:count * factor], count)
+                lows.append(low)
+                highs.append(high)
+        if not lows:
+            return np.zeros(0, dtype=np.int16), np.zeros(0, dtype=np.int16)
+        return np.concatenate(lows), np.concatenate(highs)
+
+    @staticmethod
+    def _waveform_envelope(audio_data: np.ndarray, max_points: int):
+        """Decimate to at most max_points buckets, keeping each bucket's min and max.
+
+        Stride slicing drops the peaks between kept samples; the min/max
+        envelope keeps the full amplitude range of every bucket.
+        """
+        factor = len(audio_data) // max_points
+        if factor <= 1:
+            return audio_data, audio_data
+        buckets = audio_data[:max_points * factor].reshape(max_points, factor)
+        return buckets.min(axis=1), buckets.max(axis=1)
+
+    @staticmethod
+    def _render_waveform_image(lows: np.ndarray, highs: np.ndarray, width: int, height: int) -> QImage:
+        """Draw a waveform envelope straight into a QImage with QPainter"""
+        # QImage (unlike QPixmap) may be painted outside the GUI thread
+        image = QImage(width, height, QImage.Format.Format_RGB32)
+        image.fill(QColor("white"))
+        if len(lows) < 2:
+            return image
+
+        # Leave a 5% margin on each side, like matplotlib's autoscaled axes
+        margin_x = width * 0.05
+        margin_y = height * 0.05
+        lo, hi = float(lows.min()), float(highs.max())
+        span = hi - lo if hi > lo else 1.0
+        y_scale = (height - 2 * margin_y) / span
+        xs = margin_x + np.arange(len(lows)) * ((width - 2 * margin_x) / (len(lows) - 1))
+        ys_high = (height - margin_y) - (highs.astype(np.float32) - lo) * y_scale
+        ys_low = (height - margin_y) - (lows.astype(np.float32) - lo) * y_scale
+
+        # One closed outline (upper edge forward, lower edge back) filled in a
+        # single pass; stroking a zig-zag min/max polyline is far slower
+        outline_x = np.concatenate([xs, xs[::-1]]).tolist()
+        outline_y = np.concatenate([ys_high, ys_low[::-1]]).tolist()
+        polygon = QPolygonF([QPointF(x, y) for x, y in zip(outline_x, outline_y)])
+
+        painter = QPainter(image)
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        painter.setPen(QPen(QColor("blue"), 1.5))
+        painter.setBrush(QColor("blue"))
+        painter.drawPolygon(polygon)
+        painter.end()
+        return image
+
     def browse_audio(self):
         """Browse for audio to analyze"""
         file_path, _ = QFileDialog.getOpenFileName(
@@ -93,18 +197,13 @@ class AudioSteganalysisWindow(QWidget):
                 if hasattr(self.main_gui, 'aud_results_text'):
                     self.main_gui.aud_results_text.append(f"Error loading audio: {file_path}")
 
-    def on_audio_method_changed(self):
-        """Handle audio method dropdown change"""
-        method = self.main_gui.audio_method_combo.currentText()
-        self.update_method_description(method, self.main_gui.audio_method_description)
-
-    def update_method_description(self, method_name: str, description_widget: QLabel):
-        """Update the method description based on selected method"""
-        description = self.method_descriptions.get(method_name, "No description available for this method.")
-        description_widget.setText(description)
+    @classmethod
+    def describe_method(cls, method_name: str) -> str:
+        """Help text for a method; stored on the combo items when they are created"""
+        return cls.METHOD_DESCRIPTIONS.get(method_name, "No description available for this method.")
 
     def analyze_audio(self):
-        """Analyze the selected audio"""
+        """Analyze the selected audio on a background worker"""
         if not self.main_gui.audio_path.text():
             self.main_gui.aud_results_text.append(
                 "Error: Please select an audio file to analyze")
@@ -117,113 +216,251 @@ class AudioSteganalysisWindow(QWidget):
         # Show progress bar
         self.main_gui.aud_progress_bar.setVisible(True)
         self.main_gui.aud_progress_bar.setValue(0)
-        self.main_gui.aud_progress_bar.setFormat("Loading")
-        from PyQt6.QtWidgets import QApplication
-        QApplication.processEvents()
+        self.main_gui.aud_progress_bar.setFormat("Analyzing")
+        # The shared machine must not load another file or start a second
+        # analysis until this one has finished
+        self.main_gui.set_analysis_inputs_enabled(False)
 
+        # Read widget state here; the worker must not touch the GUI
         method = self.main_gui.audio_method_combo.currentText()
-        
-        # Set sensitivity level from GUI
         sensitivity_level = self.main_gui.get_sensitivity_level("audio")
+
+        self._worker = AnalysisWorker(self._run_audio_analysis, method, sensitivity_level)
+        self._worker.signals.finished.connect(self._on_audio_analysis_finished)
+        self._worker.signals.error.connect(self._on_audio_analysis_error)
+        QThreadPool.globalInstance().start(self._worker)
+
+    def _run_audio_analysis(self, method: str, sensitivity_level: str):
+        """Worker job: run the analysis and prepare chart arrays (no widget access)"""
         self.machine.set_sensitivity_level(sensitivity_level)
-        
-        ok = self.machine.analyze_audio(method)
+        if not self.machine.analyze_audio(method):
+            return {"method": method, "error": "Error during audio analysis."}
+
+        payload = {
+            "method": method,
+            "results": self.machine.get_results(),
+            "confidence": self.machine.get_confidence_level(),
+            "stats": self.machine.get_audio_statistics(),
+        }
+        try:
+            payload["charts"] = self._compute_audio_chart_data(
+                self.machine.audio_samples, self.machine.audio_sample_rate)
+        except Exception as e:
+            payload["chart_error"] = str(e)
+        return payload
+
+    def _on_audio_analysis_error(self, message: str):
+        """Report an exception raised inside the worker"""
+        self.main_gui.aud_results_text.append(f"Error during audio analysis: {message}")
+        self._finish_audio_analysis()
+
+    def _finish_audio_analysis(self):
+        self.main_gui.aud_progress_bar.setVisible(False)
+        self.main_gui.set_analysis_inputs_enabled(True)
+        self._worker = None
 
+    def _on_audio_analysis_finished(self, payload: dict):
+        """Paint results, statistics and charts on the GUI thread"""
         self.main_gui.aud_results_text.append("\n=== AUDIO ANALYSIS ===")
-        if not ok:
-            self.main_gui.aud_results_text.append("Error during audio analysis.")
-            self.main_gui.aud_progress_bar.setVisible(False)
+        if "error" in payload:
+            self.main_gui.aud_results_text.append(payload["error"])
+            self._finish_audio_analysis()
             return
 
-        results = self.machine.get_results()
-        confidence = self.machine.get_confidence_level()
-        stats = self.machine.get_audio_statistics()
+        results = payload["results"]
+        confidence = payload["confidence"]
+        stats = payload["stats"]
 
-        self.main_gui.aud_results_text.append(f"Method: {results.get('method', method)}")
-        self.main_gui.aud_results_text.append(f"Suspicious: {results.get('suspicious', False)}")
+        # Lines are collected and appended once: every QTextEdit.append()
+        # re-lays out the document
+        lines = [f"Method: {results.get('method', payload['method'])}",
+                 f"Suspicious: {results.get('suspicious', False)}"]
         for k, v in results.items():
             if k in ("method", "suspicious"):
                 continue
-            self.main_gui.aud_results_text.append(f"{k}: {v}")
+            lines.append(f"{k}: {v}")
 
-        self.main_gui.aud_results_text.append(f"Confidence level: {confidence*100:.2f}%")
+        lines.append(f"Confidence level: {confidence*100:.2f}%")
+        self.main_gui.aud_results_text.append("\n".join(lines))
 
-        self.main_gui.aud_stats_text.append("Audio Statistics:")
-        for k, v in stats.items():
-            self.main_gui.aud_stats_text.append(f"- {k}: {v}")
+        stats_lines = ["Audio Statistics:"]
+        stats_lines.extend(f"- {k}: {v}" for k, v in stats.items())
+        self.main_gui.aud_stats_text.append("\n".join(stats_lines))
 
         # === Charts ===
-        try:
-            self._plot_audio_charts()
-        except Exception as e:
-            self.main_gui.aud_results_text.append(f"Audio chart error: {e}")
+        if "chart_error" in payload:
+            self.main_gui.aud_results_text.append(f"Audio chart error: {payload['chart_error']}")
+        elif "charts" in payload:
+            try:
+                self._plot_audio_charts(payload["charts"])
+            except Exception as e:
+                self.main_gui.aud_results_text.append(f"Audio chart error: {e}")
 
         # Hide progress bar
-        self.main_gui.aud_progress_bar.setVisible(False)
+        self._finish_audio_analysis()
+
+    @staticmethod
+    def _power_spectrogram(data, sr, nfft: int, noverlap: int):
+        """One-sided PSD spectrogram scaled like mlab.specgram (Hann window, no detrend).
+
+        Frames are strided views of the float32 signal and go through a single
+        batched scipy.fft.rfft on all cores instead of numpy's per-frame fft.
+        """
+        if len(data) < nfft:
+            data = np.pad(data, (0, nfft - len(data)))
+        step = nfft - noverlap
+        frames = np.lib.stride_tricks.sliding_window_view(data, nfft)[::step]
+        # pocketfft keeps its own plan cache, so repeated analyses reuse the
+        # twiddle tables; the window is cached here, and the windowed frames are
+        # a temporary the transform may use as scratch space
+        window = hann_window(nfft)
+        spectrum = scipy.fft.rfft(frames * window, axis=1, workers=-1, overwrite_x=True)
+
+        # |X|^2 via one contiguous abs() pass, then squared in place; squaring
+        # the strided .real/.imag views separately is about twice as slow
+        Pxx = np.abs(spectrum)
+        Pxx *= Pxx
+        # Density scaling; double every bin except DC (and Nyquist for even nfft)
+        Pxx /= sr * float(np.square(window).sum())
+        Pxx[:, 1:(nfft + 1) // 2] *= 2.0
+
+        freqs = scipy.fft.rfftfreq(nfft, 1.0 / sr)
+        bins = (np.arange(len(frames)) * step + nfft / 2) / sr
+        return Pxx.T, freqs, bins
 
-    def _plot_audio_charts(self):
-        """Render Waveform, Spectrogram, and Entropy for the current audio."""
-        samples = self.machine.audio_samples
-        sr = self.machine.audio_sample_rate
+    @staticmethod
+    def _compute_audio_chart_data(samples, sr):
+        """Compute waveform, spectrogram and short-time entropy for the charts"""
         if samples is None or not sr:
-            return
+            return None
 
-        # Use first channel if stereo
+        # Use first channel if stereo, like the analyses themselves
+        # (_first_channel_float32), so the charts show the analyzed signal
         if samples.ndim == 2:
             data = samples[:, 0]
         else:
             data = samples
 
-        data = data.astype(np.float32)
-
-        # Waveform
-        ax_wave = self.main_gui.aud_canvas_wave.figure.subplots(1, 1)
-        self.main_gui.aud_canvas_wave.figure.subplots_adjust(left=0.1, right=0.95, top=0.9, bottom=0.1)
-        ax_wave.clear()
-        t = np.arange(len(data)) / float(sr)
-        ax_wave.plot(t, data, color='#34495e', linewidth=0.8)
-        ax_wave.set_title('Waveform')
-        ax_wave.set_xlabel('Time (s)')
-        ax_wave.set_ylabel('Amplitude')
-        ax_wave.grid(True, alpha=0.2)
-        self.main_gui.aud_canvas_wave.draw()
-
-        # Spectrogram (log-magnitude)
-        ax_spec = self.main_gui.aud_canvas_spec.figure.subplots(1, 1)
-        self.main_gui.aud_canvas_spec.figure.subplots_adjust(left=0.1, right=0.95, top=0.9, bottom=0.1)
-        ax_spec.clear()
-        nfft = 1024
-        noverlap = 512
-        Pxx, freqs, bins, im = ax_spec.specgram(data, NFFT=nfft, Fs=sr, noverlap=noverlap, cmap='magma')
-        ax_spec.set_title('Spectrogram')
-        ax_spec.set_xlabel('Time (s)')
-        ax_spec.set_ylabel('Frequency (Hz)')
-        self.main_gui.aud_canvas_spec.draw()
+        # One contiguous float32 buffer for the FFT frames and the entropy
+        # pass (the stereo column is a stride-2 view); already-float32 mono
+        # input is used as is
+        data = np.ascontiguousarray(data, dtype=np.float32)
+
+        # Waveform: min/max per bucket, interleaved so each bucket draws as a
+        # vertical stroke; the line then has a few thousand vertices instead of
+        # one per sample, whatever the length of the file
+        points = AudioSteganalysisWindow.WAVE_CHART_POINTS
+        lows, highs = AudioSteganalysisWindow._waveform_envelope(data, points)
+        if lows is highs:
+            wave_t = np.arange(len(data)) / float(sr)
+            wave = data
+        else:
+            factor = len(data) // points
+            wave_t = np.repeat(np.arange(points) * (factor / float(sr)), 2)
+            wave = np.column_stack((lows, highs)).ravel()
+
+        # Spectrogram (log-magnitude), same parameters as Axes.specgram
+        Pxx, freqs, bins = AudioSteganalysisWindow._power_spectrogram(data, sr, nfft=1024, noverlap=512)
+        # dB in place: Pxx is a fresh array, so no extra full-size temporaries
+        with np.errstate(divide='ignore'):
+            spec_db = np.log10(Pxx, out=Pxx)
+        spec_db *= 10.0
+        # Color limits are found here so the GUI thread only swaps the pixels.
+        # Digital silence gives -inf dB; like the specgram autoscale, those
+        # pixels are left out of the limits (imshow masks them as invalid)
+        spec_clim = (float(spec_db.min()), float(spec_db.max()))
+        if not np.isfinite(spec_clim).all():
+            finite = spec_db[np.isfinite(spec_db)]
+            spec_clim = (float(finite.min()), float(finite.max())) if finite.size else (-1.0, 1.0)
 
         # Entropy over time (short-time 8-bit entropy)
-        ax_ent = self.main_gui.aud_canvas_entropy.figure.subplots(1, 1)
-        self.main_gui.aud_canvas_entropy.figure.subplots_adjust(left=0.1, right=0.95, top=0.9, bottom=0.1)
-        ax_ent.clear()
-        # Normalize to 8-bit range
-        x = data - np.min(data)
-        denom = (np.max(x) - np.min(x) + 1e-9)
-        x = (x / denom * 255.0).astype(np.uint8)
+        # Normalize to 8-bit range: one shifted copy, scaled in place (its
+        # minimum is 0 by construction, so only the maximum is searched)
+        x = data - data.min()
+        x /= float(x.max()) + 1e-9
+        x *= 255.0
+        x = x.astype(np.uint8)
         win = max(int(sr * 0.05), 256)  # 50 ms window
         hop = max(win // 2, 128)
-        ent_values = []
-        times = []
-        for start in range(0, len(x) - win + 1, hop):
-            seg = x[start:start + win]
-            hist, _ = np.histogram(seg, bins=256, range=(0, 256))
-            p = hist.astype(np.float32)
-            p = p / max(np.sum(p), 1.0)
-            p = p[p > 0]
-            ent = float(-np.sum(p * np.log2(p)))
-            ent_values.append(ent)
-            times.append(start / float(sr))
-        ax_ent.plot(times, ent_values, color='#8e44ad', linewidth=1.2)
-        ax_ent.set_title('Short-time Entropy')
-        ax_ent.set_xlabel('Time (s)')
-        ax_ent.set_ylabel('Entropy (bits)')
-        ax_ent.grid(True, alpha=0.2)
-        self.main_gui.aud_canvas_entropy.draw()
+        ent_values = AudioSteganalysisWindow._short_time_entropy(x, win, hop)
+        times = np.arange(len(ent_values)) * hop / float(sr)
+
+        return {"t": wave_t, "data": wave,
+                "spec_db": spec_db, "spec_clim": spec_clim, "freqs": freqs, "bins": bins,
+                "ent_times": times, "ent_values": ent_values}
+
+    @staticmethod
+    def _row_histograms(rows, block=256):
+        """256-bin histogram of every row of a 2-D uint8 array"""
+        out = np.empty((len(rows), 256), dtype=np.int32)
+        # Offsetting row i by 256 * i turns one bincount into a histogram per
+        # row; blocks bound the int32 index copy to block * row-length samples
+        offsets = 256 * np.arange(block, dtype=np.int32)[:, None]
+        for lo in range(0, len(rows), block):
+            chunk = rows[lo:lo + block]
+            n = len(chunk)
+            out[lo:lo + n] = np.bincount((chunk + offsets[:n]).ravel(),
+                                         minlength=256 * n).reshape(n, 256)
+        return out
+
+    @staticmethod
+    def _short_time_entropy(x, win, hop):
+        """Shannon entropy (bits) of every win-sample window of a uint8 signal, hop apart (hop <= win)"""
+        if len(x) < win:
+            return np.zeros(0)
+        n = (len(x) - win) // hop + 1
+        # Overlapping windows share whole hop-long blocks: each block is counted
+        # once, and a window's histogram is the sum of the k blocks it spans
+        # plus its r trailing samples, so every sample is counted ~once
+        # instead of win / hop times
+        k, r = divmod(win, hop)
+        num_blocks = n - 1 + k
+        block_counts = AudioSteganalysisWindow._row_histograms(
+            x[:num_blocks * hop].reshape(num_blocks, hop))
+        counts = block_counts[:n].copy()
+        for j in range(1, k):
+            counts += block_counts[j:j + n]
+        if r:
+            tails = np.lib.stride_tricks.sliding_window_view(x[k * hop:], r)[::hop][:n]
+            counts += AudioSteganalysisWindow._row_histograms(tails)
+
+        # H = log2(win) - sum(c * log2(c)) / win, with c * log2(c) looked up
+        # from a table over the possible counts instead of a log per bin
+        c = np.arange(1, win + 1)
+        clog2c = np.zeros(win + 1)
+        clog2c[1:] = c * np.log2(c)
+        return np.log2(win) - np.take(clog2c, counts).sum(axis=1) / win
+
+    @staticmethod
+    def _update_line(ax, line, x, y):
+        """Swap the data of a persistent Line2D and rescale its axes"""
+        line.set_data(x, y)
+        ax.relim()
+        ax.autoscale_view()
+
+    def _plot_audio_charts(self, charts: dict):
+        """Render Waveform, Spectrogram, and Entropy from precomputed chart data."""
+        if not charts:
+            return
+        self.main_gui.ensure_audio_charts()
+
+        # Waveform: reuse the persistent line built with the canvas
+        self._update_line(self.main_gui.aud_wave_ax, self.main_gui.aud_wave_line,
+                          charts["t"], charts["data"])
+        self.main_gui.aud_canvas_wave.draw_idle()
+
+        # Spectrogram (log-magnitude): update the persistent image in place
+        spec_db = charts["spec_db"]
+        bins = charts["bins"]
+        freqs = charts["freqs"]
+        pad = (bins[1] - bins[0]) / 2 if len(bins) > 1 else 0.5
+        image = self.main_gui.aud_spec_image
+        image.set_data(spec_db)
+        image.set_extent((bins[0] - pad, bins[-1] + pad, freqs[0], freqs[-1]))
+        image.set_clim(*charts["spec_clim"])
+        self.main_gui.aud_canvas_spec.draw_idle()
+
+        # Entropy over time
+        self._update_line(self.main_gui.aud_ent_ax, self.main_gui.aud_ent_line,
+                          charts["ent_times"], charts["ent_values"])
+        self.main_gui.aud_canvas_entropy.draw_idle()
@@ -1,36 +1,41 @@
 # gui/steganalysis_window.py
 import datetime
-from pathlib import Path
-import numpy as np
-from PIL import Image
-import io
-import wave
-import matplotlib.pyplot as plt
-import cv2
+import functools
 import math
-import random
 import os
+import pickle
 
-
-# gui/steganalysis_window.py
+import numpy as np
 from PyQt6.QtWidgets import (QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
                              QLabel, QPushButton, QFrame, QFileDialog, QTextEdit,
-                             QGroupBox, QGridLayout, QLineEdit, QComboBox, QProgressBar, QApplication,
-                             QStackedWidget, QHBoxLayout, QSizePolicy, QTabWidget, QSpacerItem, QScrollArea)
-from PyQt6.QtCore import Qt, QSize, QTimer
-from PyQt6.QtGui import QFont, QPixmap, QPainter, QColor, QPen, QLinearGradient, QBrush
-import numpy as np
-import cv2
-
-# Matplotlib for charts (QtAgg backend for PyQt6)
-from matplotlib.backends.backend_qtagg import FigureCanvasQTAgg as FigureCanvas
-from matplotlib.figure import Figure
-from matplotlib.backends.backend_pdf import PdfPages
+                             QGroupBox, QLineEdit, QComboBox, QProgressBar, QApplication,
+                             QSizePolicy, QTabWidget, QScrollArea)
+from PyQt6.QtCore import Qt, QTimer, QThreadPool
+from PyQt6.QtGui import QFont, QPixmap, QImage, QPainter, QColor, QPen
 
 # Import individual window modules
 from gui.image_steganalysis_window import ImageSteganalysisWindow
 from gui.audio_steganalysis_window import AudioSteganalysisWindow
 from gui.video_steganalysis_window import VideoSteganalysisWindow
+from gui.workers import AnalysisWorker
+
+STYLESHEET_PATH = "asset/steganalysis.qss"
+
+
+@functools.lru_cache(maxsize=None)
+def _read_stylesheet(path: str) -> str:
+    with open(path, encoding="utf-8") as f:
+        return f.read()
+
+
+def load_stylesheet(path: str = STYLESHEET_PATH) -> str:
+    """Read the steganalysis QSS once; later windows reuse the cached text"""
+    # Only a successful read is cached, so a missing file is retried next time
+    try:
+        return _read_stylesheet(path)
+    except OSError as e:
+        print(f"Warning: Could not load stylesheet from {path}: {e}")
+        return ""
 
 
 class CyberBackgroundWidget(QWidget):
@@ -173,6 +178,76 @@ class CyberBackgroundWidget(QWidget):
         painter.drawLine(scan_x2, 0, scan_x2, self.height())
 
 
+class ChartImageView(QFrame):
+    """Titled chart panel that shows a uint8 map directly as a QImage.
+
+    Grayscale (H, W) and RGB (H, W, 3) arrays are copied once into a pixmap,
+    which is rescaled to the panel whenever it is resized.
+    """
+
+    def __init__(self, title: str):
+        super().__init__()
+        self.setObjectName("chartPanel")
+        self.title = title
+        self.array = None
+        self._pixmap = None
+        self._figure = None
+        layout = QVBoxLayout(self)
+        layout.setContentsMargins(10, 10, 10, 10)
+        title_label = QLabel(title)
+        title_label.setObjectName("chartTitle")
+        title_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        layout.addWidget(title_label)
+        self.image_label = QLabel()
+        self.image_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        self.image_label.setSizePolicy(QSizePolicy.Policy.Ignored, QSizePolicy.Policy.Ignored)
+        layout.addWidget(self.image_label, 1)
+
+    def set_image(self, array: np.ndarray):
+        """Show a uint8 grayscale or RGB array"""
+        array = np.ascontiguousarray(array, dtype=np.uint8)
+        height, width = array.shape[:2]
+        if array.ndim == 3:
+            qimg = QImage(array.data, width, height, array.strides[0], QImage.Format.Format_RGB888)
+        else:
+            qimg = QImage(array.data, width, height, array.strides[0], QImage.Format.Format_Grayscale8)
+        # fromImage copies the pixels, so the array may be released afterwards
+        self._pixmap = QPixmap.fromImage(qimg)
+        self.array = array
+        self._figure = None
+        self._rescale()
+
+    def export_figure(self):
+        """Return the shown map laid out on a matplotlib figure, built once per image"""
+        if self._figure is None and self.array is not None:
+            from matplotlib.figure import Figure
+
+            figure = Figure(figsize=(10, 4), dpi=100)
+            ax = figure.add_subplot(111)
+            figure.subplots_adjust(left=0.05, right=0.95, top=0.9, bottom=0.05)
+            if self.array.ndim == 3:
+                ax.imshow(self.array)
+            else:
+                ax.imshow(self.array, cmap='gray', vmin=0, vmax=255)
+            ax.set_title(self.title, fontsize=11)
+            ax.axis('off')
+            self._figure = figure
+        return self._figure
+
+    def _rescale(self):
+        if self._pixmap is None:
+            return
+        size = self.image_label.size()
+        if size.width() < 2 or size.height() < 2:
+            return
+        self.image_label.setPixmap(self._pixmap.scaled(
+            size, Qt.AspectRatioMode.KeepAspectRatio, Qt.TransformationMode.SmoothTransformation))
+
+    def resizeEvent(self, event):
+        super().resizeEvent(event)
+        self._rescale()
+
+
 class SteganalysisWindow(QMainWindow):
     def __init__(self):
         super().__init__()
@@ -195,51 +270,12 @@ class SteganalysisWindow(QMainWindow):
         self.audio_window.set_main_gui(self)
         self.video_window.set_main_gui(self)
 
-        # Method descriptions
-        self.method_descriptions = {
-            # Image analysis methods
-            "LSB Analysis": "Analyzes the least significant bits of each pixel to detect hidden data. LSB steganography is the most common method of hiding information in images.",
-            "Chi-Square Test": "Performs statistical analysis on pixel value distributions to detect anomalies that may indicate steganographic content.",
-            "RS Analysis": "Regular-Singular analysis examines how flipping LSBs affects image smoothness to detect LSB steganography with high accuracy.",
-            "Sample Pairs Analysis": "Analyzes adjacent pixel pairs to detect statistical anomalies that may indicate hidden data in the image.",
-            "DCT Analysis": "Discrete Cosine Transform analysis examines frequency domain characteristics to detect steganography in JPEG images.",
-            "Wavelet Analysis": "Analyzes image using wavelet transforms to detect steganographic artifacts in different frequency bands.",
-            "Histogram Analysis": "Examines pixel value histograms for unusual patterns that may indicate hidden information.",
-            "Advanced Comprehensive": "Uses all available detection methods with advanced algorithms for the most thorough steganalysis possible.",
-
-            # Audio analysis methods
-            "Audio LSB Analysis": "Analyzes least significant bits in audio samples to detect hidden data embedded in audio files.",
-            "Audio Chi-Square Test": "Statistical analysis of audio sample distributions to identify anomalies that may indicate steganographic content.",
-            "Audio Spectral Analysis": "Examines frequency domain characteristics and power spectral density to detect audio steganography.",
-            "Audio Autocorrelation Analysis": "Analyzes temporal patterns and periodic structures in audio to detect hidden information.",
-            "Audio Entropy Analysis": "Measures randomness and information content in audio samples to identify steganographic artifacts.",
-            "Audio Comprehensive Analysis": "Combines multiple audio detection methods for thorough analysis of potential hidden content.",
-            "Audio Advanced Comprehensive": "Uses all available audio analysis techniques for the most comprehensive steganalysis possible.",
-
-            # Video analysis methods
-            "Video LSB Analysis": "Analyzes least significant bits in video frames to detect hidden data embedded in video files.",
-            "Video Frame Analysis": "Examines individual video frames for anomalies and statistical irregularities that may indicate steganography.",
-            "Video Motion Analysis": "Analyzes motion vectors and temporal patterns between frames to detect hidden information.",
-            "Video Advanced Comprehensive": "Uses all available video analysis techniques for the most comprehensive steganalysis possible."
-        }
-
-        # Cybersecurity theme: fonts & background
-        # Colors:
-        #   Background: #0e1625 (very dark navy)
-        #   Headings/accents: #49299a (purple)
-        #   Highlights/buttons: #45edf2 (aqua/cyan)
-        #   Light contrast: #e8e8fc (very light lavender)
-        self.setStyleSheet("""
-            QMainWindow {
-                background-color: #0e1625;
-                font-family: 'Syne', 'Segoe UI', 'Arial', sans-serif;
-                color: #e8e8fc;
-            }
-            QWidget {
-                font-family: 'Syne', 'Segoe UI', 'Arial', sans-serif;
-                color: #e8e8fc;
-            }
-        """)
+        # PDF export running on the thread pool, if any
+        self._export_worker = None
+
+        # Cybersecurity theme: the whole window is styled from one QSS file;
+        # widgets opt in through their objectName
+        self.setStyleSheet(load_stylesheet())
 
         # Create central widget and main layout
         central_widget = QWidget()
@@ -314,26 +350,9 @@ class SteganalysisWindow(QMainWindow):
         title_layout = QHBoxLayout()
 
         # Back button with cyber theme
-        back_button = QPushButton("← Back to Main")
-        back_button.setStyleSheet("""
-            QPushButton {
-                background: rgba(69,237,242,0.1);
-                color: #e8e8fc;
-                border: 2px solid rgba(69,237,242,0.6);
-                padding: 10px 20px;
-                border-radius: 12px;
-                font-weight: bold;
-                font-size: 14px;
-            }
-            QPushButton:hover {
-                background: rgba(69,237,242,0.3);
-                border: 3px solid rgba(69,237,242,1.0);
-            }
-            QPushButton:pressed {
-                background: rgba(69,237,242,0.3);
-            }
-        """)
-        back_button.clicked.connect(self.go_back)
+        self.back_button = QPushButton("← Back to Main")
+        self.back_button.setObjectName("backButton")
+        self.back_button.clicked.connect(self.go_back)
 
         # Title with cyber theme
         title_label = QLabel("Steganalysis - Detect Hidden Messages")
@@ -342,9 +361,9 @@ class SteganalysisWindow(QMainWindow):
         title_font.setBold(True)
         title_label.setFont(title_font)
         title_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        title_label.setStyleSheet("color: #45edf2; margin: 10px 0;")
+        title_label.setObjectName("windowTitle")
 
-        title_layout.addWidget(back_button)
+        title_layout.addWidget(self.back_button)
         title_layout.addStretch()
         title_layout.addWidget(title_label)
         title_layout.addStretch()
@@ -356,33 +375,7 @@ class SteganalysisWindow(QMainWindow):
         tabs = QTabWidget()
         tabs.setDocumentMode(True)
         tabs.setTabPosition(QTabWidget.TabPosition.North)
-        tabs.setStyleSheet("""
-            QTabWidget::pane {
-                border: 2px solid rgba(69,237,242,0.6);
-                border-radius: 15px;
-                background-color: rgba(14,22,37,0.8);
-            }
-            QTabWidget::tab-bar {
-                alignment: center;
-            }
-            QTabBar::tab {
-                background: rgba(69,237,242,0.1);
-                color: #e8e8fc;
-                border: 2px solid rgba(69,237,242,0.6);
-                padding: 10px 20px;
-                margin: 5px;
-                border-radius: 8px;
-                font-weight: bold;
-                font-size: 14px;
-            }
-            QTabBar::tab:selected {
-                background: rgba(69,237,242,0.3);
-                border: 3px solid rgba(69,237,242,1.0);
-            }
-            QTabBar::tab:hover {
-                background: rgba(69,237,242,0.2);
-            }
-        """)
+        tabs.setObjectName("mediaTabs")
 
         image_tab = QWidget()
         audio_tab = QWidget()
@@ -423,222 +416,92 @@ class SteganalysisWindow(QMainWindow):
 
     def _styled_panel(self) -> QFrame:
         panel = QFrame()
-        panel.setStyleSheet("""
-            QFrame { 
-                background-color: #0e1625;
-                border-radius: 15px; 
-                border: 2px solid rgba(69,237,242,0.6);
-            }
-        """)
+        panel.setObjectName("steganalysisPanel")
         return panel
 
 
-    def _build_image_controls(self) -> QWidget:
+    def _build_media_controls(self, media: str, placeholder: str, browse_cb, preview_name: str,
+                              drag_handlers, methods, analysis_window, analyze_cb):
+        """Build the input panel shared by the image, audio and video tabs.
+
+        Returns (panel, path_edit, browse_button, preview, method_combo, description, analyze_button).
+        """
         panel = self._styled_panel()
         layout = QVBoxLayout(panel)
         layout.setSpacing(20)
         layout.setContentsMargins(30, 30, 30, 30)
 
-        title = QLabel("Image Analysis Input")
-        f = QFont()
-        f.setPointSize(20)
-        f.setBold(True)
-        title.setFont(f)
-        title.setStyleSheet(
-            "color: #e8e8fc; margin-bottom: 10px; border: none;")
-
-        image_group = QGroupBox("Suspicious Image")
-        image_group.setStyleSheet("""
-            QGroupBox {
-                color: #e8e8fc;
-                font-weight: bold;
-                font-size: 16px;
-                border: 2px solid rgba(69,237,242,0.6);
-                border-radius: 10px;
-                margin-top: 10px;
-                padding-top: 10px;
-            }
-            QGroupBox::title {
-                subcontrol-origin: margin;
-                left: 10px;
-                padding: 0 5px 0 5px;
-            }
-        """)
-        image_layout = QVBoxLayout(image_group)
-        self.image_path = QLineEdit()
-        self.image_path.setPlaceholderText("Select image to analyze...")
-        self.image_path.setReadOnly(True)
-        self.image_path.setStyleSheet("""
-            QLineEdit {
-                background-color: #0e1625;
-                color: #e8e8fc;
-                border: 2px solid rgba(69,237,242,0.6);
-                border-radius: 8px;
-                padding: 8px;
-            }
-            QLineEdit:focus {
-                border: 3px solid rgba(69,237,242,1.0);
-            }
-        """)
-        browse_button = QPushButton("Browse Image")
-        browse_button.setStyleSheet("""
-            QPushButton { 
-                background: rgba(34,139,34,0.2);
-                color: #22c55e;
-                border: 2px solid #22c55e;
-                padding: 8px 16px;
-                border-radius: 8px;
-                font-weight: bold;
-                font-size: 14px;
-            }
-            QPushButton:hover { 
-                background: rgba(34,139,34,0.4);
-                border: 3px solid #22c55e;
-                color: #ffffff;
-            }
-        """)
-        browse_button.clicked.connect(self.image_window.browse_image)
-        image_layout.addWidget(self.image_path)
-        image_layout.addWidget(browse_button)
-
-        # Image preview
-        self.image_preview = QLabel()
-        self.image_preview.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        self.image_preview.setStyleSheet("""
-            QLabel {
-                border: 2px solid rgba(69,237,242,0.6);
-                border-radius: 8px;
-                background-color: #0e1625;
-                color: #e8e8fc;
-                min-height: 150px;
-                max-height: 200px;
-            }
-        """)
-        self.image_preview.setSizePolicy(
+        title = QLabel(f"{media} Analysis Input")
+        title.setObjectName("panelTitle")
+
+        media_group = QGroupBox(f"Suspicious {media}")
+        media_group.setObjectName("sectionGroup")
+        media_layout = QVBoxLayout(media_group)
+        path_edit = QLineEdit()
+        path_edit.setPlaceholderText(placeholder)
+        path_edit.setReadOnly(True)
+        path_edit.setObjectName("pathEdit")
+        browse_button = QPushButton(f"Browse {media}")
+        browse_button.setObjectName("browseButton")
+        browse_button.clicked.connect(browse_cb)
+        media_layout.addWidget(path_edit)
+        media_layout.addWidget(browse_button)
+
+        # Media preview, which also accepts files dropped directly on it
+        preview = QLabel()
+        preview.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        preview.setObjectName(preview_name)
+        preview.setSizePolicy(
             QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Fixed)
-        self.image_preview.setText("No image selected")
-        self.image_preview.setScaledContents(False)
-        self.image_preview.setAcceptDrops(True)  # Enable drag and drop directly on the preview
-        # Connect drag and drop events
-        self.image_preview.dragEnterEvent = self.image_preview_drag_enter_event
-        self.image_preview.dragLeaveEvent = self.image_preview_drag_leave_event
-        self.image_preview.dropEvent = self.image_preview_drop_event
-        image_layout.addWidget(self.image_preview)
-
-        method_group = QGroupBox("Image Analysis Method")
-        method_group.setStyleSheet("""
-            QGroupBox {
-                color: #e8e8fc;
-                font-weight: bold;
-                font-size: 16px;
-                border: 2px solid rgba(69,237,242,0.6);
-                border-radius: 10px;
-                margin-top: 10px;
-                padding-top: 10px;
-            }
-            QGroupBox::title {
-                subcontrol-origin: margin;
-                left: 10px;
-                padding: 0 5px 0 5px;
-            }
-        """)
-        method_layout = QVBoxLayout(method_group)
-        self.method_combo = QComboBox()
-        self.method_combo.addItems([
-            "LSB Analysis", "Chi-Square Test", "RS Analysis", "Sample Pairs Analysis",
-            "DCT Analysis", "Wavelet Analysis", "Histogram Analysis", "Advanced Comprehensive"
-        ])
-        self.method_combo.setStyleSheet("""
-            QComboBox { 
-                padding: 8px 12px 8px 12px; 
-                border: 2px solid #45edf2; 
-                border-radius: 8px; 
-                background-color: #0e1625;
-                color: #e8e8fc;
-                font-weight: bold;
-            }
-            QComboBox:focus { 
-                border: 3px solid #45edf2;
-                background-color: rgba(69,237,242,0.1);
-            }
-            QComboBox::drop-down {
-                subcontrol-origin: padding;
-                subcontrol-position: top right;
-                width: 30px;
-                border-left: 2px solid #45edf2;
-                border-top-right-radius: 8px;
-                border-bottom-right-radius: 8px;
-                background-color: #45edf2;
-            }
-            QComboBox::down-arrow {
-                image: none;
-                border: none;
-                width: 0;
-                height: 0;
-                border-left: 5px solid transparent;
-                border-right: 5px solid transparent;
-                border-top: 6px solid #0e1625;
-                margin: 0 8px;
-            }
-            QComboBox QAbstractItemView {
-                border: 2px solid #45edf2;
-                border-radius: 8px;
-                background-color: #0e1625;
-                color: #e8e8fc;
-                selection-background-color: rgba(69,237,242,0.3);
-            }
-        """)
-        self.method_combo.currentTextChanged.connect(
-            self.image_window.on_image_method_changed)
-        method_layout.addWidget(self.method_combo)
-
-        self.img_analyze_btn = QPushButton("Analyze Image")
-        self.img_analyze_btn.setStyleSheet("""
-            QPushButton { 
-                background: rgba(255,140,0,0.2);
-                color: #ff8c00;
-                border: 2px solid #ff8c00;
-                padding: 12px 24px;
-                border-radius: 12px;
-                font-size: 14px;
-                font-weight: bold;
-            }
-            QPushButton:hover { 
-                background: rgba(255,140,0,0.4);
-                border: 3px solid #ff8c00;
-                color: #ffffff;
-            }
-            QPushButton:pressed {
-                background: rgba(255,140,0,0.4);
-            }
-        """)
-        self.img_analyze_btn.clicked.connect(self.image_window.analyze_image)
-
-        # Method description
-        self.image_method_description = QLabel()
-        self.image_method_description.setWordWrap(True)
-        self.image_method_description.setStyleSheet("""
-            QLabel {
-                background-color: #0e1625;
-                border: 2px solid rgba(69,237,242,0.6);
-                border-radius: 8px;
-                padding: 10px;
-                font-size: 12px;
-                color: #e8e8fc;
-                min-height: 60px;
-            }
-        """)
-        # Initialize with LSB Analysis description
-        self.image_window.update_method_description(
-            "LSB Analysis", self.image_method_description)
+        preview.setText(f"No {media.lower()} selected")
+        preview.setAcceptDrops(True)
+        preview.dragEnterEvent, preview.dragLeaveEvent, preview.dropEvent = drag_handlers
+        media_layout.addWidget(preview)
 
+        method_group = QGroupBox(f"{media} Analysis Method")
+        method_group.setObjectName("sectionGroup")
+        method_layout = QVBoxLayout(method_group)
+        method_combo = QComboBox()
+        for method in methods:
+            method_combo.addItem(method, analysis_window.describe_method(method))
+        method_combo.setObjectName("methodCombo")
+        method_layout.addWidget(method_combo)
+
+        # Method description, initialized with the first method's text
+        description = QLabel()
+        description.setWordWrap(True)
+        description.setObjectName("methodDescription")
+        description.setText(method_combo.currentData())
+        method_combo.currentIndexChanged.connect(
+            lambda _index: self._on_method_changed(method_combo, description))
+
+        analyze_button = QPushButton(f"Analyze {media}")
+        analyze_button.setObjectName("analyzeButton")
+        analyze_button.clicked.connect(analyze_cb)
 
         layout.addWidget(title)
-        layout.addWidget(image_group)
+        layout.addWidget(media_group)
         layout.addWidget(method_group)
-        layout.addWidget(self.image_method_description)
-        layout.addWidget(self.img_analyze_btn)
+        layout.addWidget(description)
+        layout.addWidget(analyze_button)
         layout.addStretch()
+        return panel, path_edit, browse_button, preview, method_combo, description, analyze_button
+
+    @staticmethod
+    def _on_method_changed(combo: QComboBox, description_widget: QLabel):
+        """Show the help text stored on the selected method's combo item"""
+        description_widget.setText(combo.currentData())
+
+    def _build_image_controls(self) -> QWidget:
+        (panel, self.image_path, self.img_browse_btn, self.image_preview, self.method_combo,
+         self.image_method_description, self.img_analyze_btn) = self._build_media_controls(
+            "Image", "Select image to analyze...", self.image_window.browse_image, "imagePreview",
+            (self.image_preview_drag_enter_event, self.image_preview_drag_leave_event,
+             self.image_preview_drop_event),
+            ("LSB Analysis", "Chi-Square Test", "RS Analysis", "Sample Pairs Analysis",
+             "DCT Analysis", "Wavelet Analysis", "Histogram Analysis", "Advanced Comprehensive"),
+            self.image_window,
+            self.image_window.analyze_image)
         return panel
 
     def _build_image_results(self) -> QWidget:
@@ -651,12 +514,7 @@ class SteganalysisWindow(QMainWindow):
         header_layout = QHBoxLayout()
         
         title = QLabel("Image Analysis Results")
-        f = QFont()
-        f.setPointSize(20)
-        f.setBold(True)
-        title.setFont(f)
-        title.setStyleSheet(
-            "color: #e8e8fc; margin-bottom: 10px; border: none;")
+        title.setObjectName("panelTitle")
         
         # Add spacer to push sensitivity to the right
         header_layout.addWidget(title)
@@ -664,22 +522,7 @@ class SteganalysisWindow(QMainWindow):
         
         # Create narrow sensitivity level control with border and label
         sensitivity_group = QGroupBox("Sensitivity")
-        sensitivity_group.setStyleSheet("""
-            QGroupBox {
-                color: #e8e8fc;
-                font-weight: bold;
-                font-size: 12px;
-                border: 2px solid rgba(69,237,242,0.6);
-                border-radius: 8px;
-                margin-top: 5px;
-                padding-top: 5px;
-            }
-            QGroupBox::title {
-                subcontrol-origin: margin;
-                left: 8px;
-                padding: 0 3px 0 3px;
-            }
-        """)
+        sensitivity_group.setObjectName("sensitivityGroup")
         sensitivity_layout = QVBoxLayout(sensitivity_group)
         sensitivity_layout.setContentsMargins(8, 5, 8, 8)
         
@@ -691,176 +534,36 @@ class SteganalysisWindow(QMainWindow):
         ])
         self.image_sensitivity_combo.setCurrentIndex(0)  # Default to Ultra
         self.image_sensitivity_combo.setMaximumWidth(140)  # Make it narrow
-        self.image_sensitivity_combo.setStyleSheet("""
-            QComboBox {
-                background-color: #0e1625;
-                color: #e8e8fc;
-                border: 2px solid rgba(69,237,242,0.6);
-                border-radius: 6px;
-                padding: 4px;
-                font-size: 11px;
-            }
-            QComboBox:focus {
-                border: 3px solid rgba(69,237,242,1.0);
-            }
-            QComboBox::drop-down {
-                border: none;
-            }
-            QComboBox::down-arrow {
-                image: none;
-                border-left: 3px solid transparent;
-                border-right: 3px solid transparent;
-                border-top: 3px solid #45edf2;
-                margin-right: 6px;
-            }
-            QComboBox QAbstractItemView {
-                background-color: #0e1625;
-                color: #e8e8fc;
-                border: 2px solid rgba(69,237,242,0.6);
-                selection-background-color: rgba(69,237,242,0.3);
-            }
-        """)
+        self.image_sensitivity_combo.setObjectName("sensitivityCombo")
         sensitivity_layout.addWidget(self.image_sensitivity_combo)
         
         header_layout.addWidget(sensitivity_group)
 
         self.img_progress_bar = QProgressBar()
         self.img_progress_bar.setVisible(False)
-        self.img_progress_bar.setStyleSheet("""
-            QProgressBar { 
-                border: 2px solid rgba(69,237,242,0.6); 
-                border-radius: 8px; 
-                text-align: center; 
-                background-color: #0e1625;
-                color: #e8e8fc;
-            }
-            QProgressBar::chunk { 
-                background-color: #45edf2; 
-                border-radius: 6px; 
-            }
-        """)
+        self.img_progress_bar.setObjectName("analysisProgress")
 
         img_results_group = QGroupBox("Detection Results")
-        img_results_group.setStyleSheet("""
-            QGroupBox {
-                color: #e8e8fc;
-                font-weight: bold;
-                font-size: 16px;
-                border: 2px solid rgba(69,237,242,0.6);
-                border-radius: 10px;
-                margin-top: 10px;
-                padding-top: 10px;
-            }
-            QGroupBox::title {
-                subcontrol-origin: margin;
-                left: 10px;
-                padding: 0 5px 0 5px;
-            }
-        """)
+        img_results_group.setObjectName("sectionGroup")
         img_results_layout = QVBoxLayout(img_results_group)
         self.img_results_text = QTextEdit()
         self.img_results_text.setReadOnly(True)
-        self.img_results_text.setStyleSheet("""
-            QTextEdit {
-                background-color: #0e1625;
-                color: #e8e8fc;
-                border: 2px solid rgba(69,237,242,0.6);
-                border-radius: 8px;
-                padding: 8px;
-            }
-        """)
+        self.img_results_text.setObjectName("resultsText")
         self.img_results_text.setPlaceholderText(
             "Analysis results will appear here...")
         img_results_layout.addWidget(self.img_results_text)
 
         # Image charts with scrollable area
         image_charts_group = QGroupBox("Image Charts")
-        image_charts_group.setStyleSheet("""
-            QGroupBox {
-                color: #e8e8fc;
-                font-weight: bold;
-                font-size: 16px;
-                border: 2px solid rgba(69,237,242,0.6);
-                border-radius: 10px;
-                margin-top: 10px;
-                padding-top: 10px;
-            }
-            QGroupBox::title {
-                subcontrol-origin: margin;
-                left: 10px;
-                padding: 0 5px 0 5px;
-            }
-        """)
-        
-        # Create scrollable area for charts
-        scroll_area = QScrollArea()
-        scroll_area.setWidgetResizable(True)
-        scroll_area.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAsNeeded)
-        scroll_area.setVerticalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAsNeeded)
-        scroll_area.setStyleSheet("""
-            QScrollArea {
-                border: none;
-                background-color: transparent;
-            }
-            QScrollBar:vertical {
-                background-color: rgba(69,237,242,0.2);
-                width: 12px;
-                border-radius: 6px;
-            }
-            QScrollBar::handle:vertical {
-                background-color: rgba(69,237,242,0.6);
-                border-radius: 6px;
-                min-height: 20px;
-            }
-            QScrollBar::handle:vertical:hover {
-                background-color: rgba(69,237,242,0.8);
-            }
-            QScrollBar:horizontal {
-                background-color: rgba(69,237,242,0.2);
-                height: 12px;
-                border-radius: 6px;
-            }
-            QScrollBar::handle:horizontal {
-                background-color: rgba(69,237,242,0.6);
-                border-radius: 6px;
-                min-width: 20px;
-            }
-            QScrollBar::handle:horizontal:hover {
-                background-color: rgba(69,237,242,0.8);
-            }
-        """)
+        image_charts_group.setObjectName("sectionGroup")
         
-
         img_stats_group = QGroupBox("Statistics")
-        img_stats_group.setStyleSheet("""
-            QGroupBox {
-                color: #e8e8fc;
-                font-weight: bold;
-                font-size: 16px;
-                border: 2px solid rgba(69,237,242,0.6);
-                border-radius: 10px;
-                margin-top: 10px;
-                padding-top: 10px;
-            }
-            QGroupBox::title {
-                subcontrol-origin: margin;
-                left: 10px;
-                padding: 0 5px 0 5px;
-            }
-        """)
+        img_stats_group.setObjectName("sectionGroup")
         img_stats_layout = QVBoxLayout(img_stats_group)
         self.img_stats_text = QTextEdit()
         self.img_stats_text.setReadOnly(True)
         self.img_stats_text.setMaximumHeight(150)
-        self.img_stats_text.setStyleSheet("""
-            QTextEdit {
-                background-color: #0e1625;
-                color: #e8e8fc;
-                border: 2px solid rgba(69,237,242,0.6);
-                border-radius: 8px;
-                padding: 8px;
-            }
-        """)
+        self.img_stats_text.setObjectName("resultsText")
         self.img_stats_text.setPlaceholderText(
             "Image statistics will appear here...")
         img_stats_layout.addWidget(self.img_stats_text)
@@ -870,39 +573,7 @@ class SteganalysisWindow(QMainWindow):
         charts_scroll.setWidgetResizable(True)
         charts_scroll.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAsNeeded)
         charts_scroll.setVerticalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAsNeeded)
-        charts_scroll.setStyleSheet("""
-            QScrollArea {
-                border: 2px solid rgba(69,237,242,0.6);
-                border-radius: 8px;
-                background-color: white;
-            }
-            QScrollBar:vertical {
-                background-color: rgba(69,237,242,0.2);
-                width: 12px;
-                border-radius: 6px;
-            }
-            QScrollBar::handle:vertical {
-                background-color: rgba(69,237,242,0.6);
-                border-radius: 6px;
-                min-height: 20px;
-            }
-            QScrollBar::handle:vertical:hover {
-                background-color: rgba(69,237,242,0.8);
-            }
-            QScrollBar:horizontal {
-                background-color: rgba(69,237,242,0.2);
-                height: 12px;
-                border-radius: 6px;
-            }
-            QScrollBar::handle:horizontal {
-                background-color: rgba(69,237,242,0.6);
-                border-radius: 6px;
-                min-width: 20px;
-            }
-            QScrollBar::handle:horizontal:hover {
-                background-color: rgba(69,237,242,0.8);
-            }
-        """)
+        charts_scroll.setObjectName("chartsScroll")
         
         # Create container for vertical chart layout
         charts_widget = QWidget()
@@ -910,25 +581,9 @@ class SteganalysisWindow(QMainWindow):
         charts_widget_layout.setSpacing(20)
         charts_widget_layout.setContentsMargins(15, 15, 15, 15)
         
-        # Create canvases that fit container width
-        self.img_canvas_lsb = FigureCanvas(Figure(figsize=(10, 4), dpi=100))
-        self.img_canvas_diff = FigureCanvas(Figure(figsize=(10, 4), dpi=100))
-        self.img_canvas_hist = FigureCanvas(Figure(figsize=(10, 4), dpi=100))
-        
-        # Set size policy to fit container width
-        self.img_canvas_lsb.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Fixed)
-        self.img_canvas_diff.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Fixed)
-        self.img_canvas_hist.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Fixed)
-        
-        # Set fixed height but let width expand
-        self.img_canvas_lsb.setFixedHeight(400)
-        self.img_canvas_diff.setFixedHeight(400)
-        self.img_canvas_hist.setFixedHeight(400)
-        
-        # Add charts vertically to the container
-        charts_widget_layout.addWidget(self.img_canvas_lsb)
-        charts_widget_layout.addWidget(self.img_canvas_diff)
-        charts_widget_layout.addWidget(self.img_canvas_hist)
+        # Chart canvases are only built on the first analysis (ensure_image_charts)
+        self.img_charts_layout = charts_widget_layout
+        self.img_view_lsb = self.img_view_diff = self.img_canvas_hist = None
         charts_widget_layout.addStretch()  # Add stretch to push charts to top
         
         # Set the charts widget as the scroll area's widget
@@ -977,41 +632,11 @@ class SteganalysisWindow(QMainWindow):
         export_buttons_layout.setSpacing(10)
         
         export_img_pdf_btn = QPushButton("Export Charts to PDF")
-        export_img_pdf_btn.setStyleSheet("""
-            QPushButton { 
-                background: rgba(147,51,234,0.2);
-                color: #9333ea;
-                border: 2px solid #9333ea;
-                padding: 10px 20px;
-                border-radius: 8px;
-                font-weight: bold;
-                font-size: 14px;
-            }
-            QPushButton:hover { 
-                background: rgba(147,51,234,0.4);
-                border: 3px solid #9333ea;
-                color: #ffffff;
-            }
-        """)
+        export_img_pdf_btn.setObjectName("exportButton")
         export_img_pdf_btn.clicked.connect(self.export_charts_pdf)
 
         export_img_report_btn = QPushButton("Export Report")
-        export_img_report_btn.setStyleSheet("""
-            QPushButton { 
-                background: rgba(147,51,234,0.2);
-                color: #9333ea;
-                border: 2px solid #9333ea;
-                padding: 10px 20px;
-                border-radius: 8px;
-                font-weight: bold;
-                font-size: 14px;
-            }
-            QPushButton:hover { 
-                background: rgba(147,51,234,0.4);
-                border: 3px solid #9333ea;
-                color: #ffffff;
-            }
-        """)
+        export_img_report_btn.setObjectName("exportButton")
         export_img_report_btn.clicked.connect(self.export_report)
         
         export_buttons_layout.addWidget(export_img_pdf_btn)
@@ -1021,210 +646,16 @@ class SteganalysisWindow(QMainWindow):
         return panel
 
     def _build_audio_controls(self) -> QWidget:
-        panel = self._styled_panel()
-        layout = QVBoxLayout(panel)
-        layout.setSpacing(20)
-        layout.setContentsMargins(30, 30, 30, 30)
-
-        title = QLabel("Audio Analysis Input")
-        f = QFont()
-        f.setPointSize(20)
-        f.setBold(True)
-        title.setFont(f)
-        title.setStyleSheet(
-            "color: #e8e8fc; margin-bottom: 10px; border: none;")
-
-        audio_group = QGroupBox("Suspicious Audio")
-        audio_group.setStyleSheet("""
-            QGroupBox {
-                color: #e8e8fc;
-                font-weight: bold;
-                font-size: 16px;
-                border: 2px solid rgba(69,237,242,0.6);
-                border-radius: 10px;
-                margin-top: 10px;
-                padding-top: 10px;
-            }
-            QGroupBox::title {
-                subcontrol-origin: margin;
-                left: 10px;
-                padding: 0 5px 0 5px;
-            }
-        """)
-        audio_layout = QVBoxLayout(audio_group)
-        self.audio_path = QLineEdit()
-        self.audio_path.setPlaceholderText("Select WAV audio to analyze...")
-        self.audio_path.setReadOnly(True)
-        self.audio_path.setStyleSheet("""
-            QLineEdit {
-                background-color: #0e1625;
-                color: #e8e8fc;
-                border: 2px solid rgba(69,237,242,0.6);
-                border-radius: 8px;
-                padding: 8px;
-            }
-            QLineEdit:focus {
-                border: 3px solid rgba(69,237,242,1.0);
-            }
-        """)
-        browse_audio_button = QPushButton("Browse Audio")
-        browse_audio_button.setStyleSheet("""
-            QPushButton { 
-                background: rgba(34,139,34,0.2);
-                color: #22c55e;
-                border: 2px solid #22c55e;
-                padding: 8px 16px;
-                border-radius: 8px;
-                font-weight: bold;
-                font-size: 14px;
-            }
-            QPushButton:hover { 
-                background: rgba(34,139,34,0.4);
-                border: 3px solid #22c55e;
-                color: #ffffff;
-            }
-        """)
-        browse_audio_button.clicked.connect(self.audio_window.browse_audio)
-        audio_layout.addWidget(self.audio_path)
-        audio_layout.addWidget(browse_audio_button)
-
-        # Audio preview (waveform)
-        self.audio_preview = QLabel()
-        self.audio_preview.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        self.audio_preview.setStyleSheet("""
-            QLabel {
-                border: 2px solid rgba(69,237,242,0.6);
-                border-radius: 8px;
-                background-color: #0e1625;
-                color: #e8e8fc;
-                min-height: 100px;
-                max-height: 150px;
-            }
-        """)
-        self.audio_preview.setSizePolicy(
-            QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Fixed)
-        self.audio_preview.setText("No audio selected")
-        self.audio_preview.setAcceptDrops(True)  # Enable drag and drop directly on the preview
-        # Connect drag and drop events
-        self.audio_preview.dragEnterEvent = self.audio_preview_drag_enter_event
-        self.audio_preview.dragLeaveEvent = self.audio_preview_drag_leave_event
-        self.audio_preview.dropEvent = self.audio_preview_drop_event
-        audio_layout.addWidget(self.audio_preview)
-
-        audio_method_group = QGroupBox("Audio Analysis Method")
-        audio_method_group.setStyleSheet("""
-            QGroupBox {
-                color: #e8e8fc;
-                font-weight: bold;
-                font-size: 16px;
-                border: 2px solid rgba(69,237,242,0.6);
-                border-radius: 10px;
-                margin-top: 10px;
-                padding-top: 10px;
-            }
-            QGroupBox::title {
-                subcontrol-origin: margin;
-                left: 10px;
-                padding: 0 5px 0 5px;
-            }
-        """)
-        audio_method_layout = QVBoxLayout(audio_method_group)
-        self.audio_method_combo = QComboBox()
-        self.audio_method_combo.addItems([
-            "Audio LSB Analysis", "Audio Chi-Square Test", "Audio Spectral Analysis",
-            "Audio Autocorrelation Analysis", "Audio Entropy Analysis", "Audio Comprehensive Analysis", "Audio Advanced Comprehensive"
-        ])
-        self.audio_method_combo.setStyleSheet("""
-            QComboBox { 
-                padding: 8px 12px 8px 12px; 
-                border: 2px solid #45edf2; 
-                border-radius: 8px; 
-                background-color: #0e1625;
-                color: #e8e8fc;
-                font-weight: bold;
-            }
-            QComboBox:focus { 
-                border: 3px solid #45edf2;
-                background-color: rgba(69,237,242,0.1);
-            }
-            QComboBox::drop-down {
-                subcontrol-origin: padding;
-                subcontrol-position: top right;
-                width: 30px;
-                border-left: 2px solid #45edf2;
-                border-top-right-radius: 8px;
-                border-bottom-right-radius: 8px;
-                background-color: #45edf2;
-            }
-            QComboBox::down-arrow {
-                image: none;
-                border: none;
-                width: 0;
-                height: 0;
-                border-left: 5px solid transparent;
-                border-right: 5px solid transparent;
-                border-top: 6px solid #0e1625;
-                margin: 0 8px;
-            }
-            QComboBox QAbstractItemView {
-                border: 2px solid #45edf2;
-                border-radius: 8px;
-                background-color: #0e1625;
-                color: #e8e8fc;
-                selection-background-color: rgba(69,237,242,0.3);
-            }
-        """)
-        self.audio_method_combo.currentTextChanged.connect(
-            self.audio_window.on_audio_method_changed)
-        audio_method_layout.addWidget(self.audio_method_combo)
-
-        self.aud_analyze_btn = QPushButton("Analyze Audio")
-        self.aud_analyze_btn.setStyleSheet("""
-            QPushButton { 
-                background: rgba(255,140,0,0.2);
-                color: #ff8c00;
-                border: 2px solid #ff8c00;
-                padding: 12px 24px;
-                border-radius: 12px;
-                font-size: 14px;
-                font-weight: bold;
-            }
-            QPushButton:hover { 
-                background: rgba(255,140,0,0.4);
-                border: 3px solid #ff8c00;
-                color: #ffffff;
-            }
-            QPushButton:pressed {
-                background: rgba(255,140,0,0.4);
-            }
-        """)
-        self.aud_analyze_btn.clicked.connect(self.audio_window.analyze_audio)
-
-        # Method description
-        self.audio_method_description = QLabel()
-        self.audio_method_description.setWordWrap(True)
-        self.audio_method_description.setStyleSheet("""
-            QLabel {
-                background-color: #0e1625;
-                border: 2px solid rgba(69,237,242,0.6);
-                border-radius: 8px;
-                padding: 10px;
-                font-size: 12px;
-                color: #e8e8fc;
-                min-height: 60px;
-            }
-        """)
-        # Initialize with Audio LSB Analysis description
-        self.audio_window.update_method_description(
-            "Audio LSB Analysis", self.audio_method_description)
-
-
-        layout.addWidget(title)
-        layout.addWidget(audio_group)
-        layout.addWidget(audio_method_group)
-        layout.addWidget(self.audio_method_description)
-        layout.addWidget(self.aud_analyze_btn)
-        layout.addStretch()
+        (panel, self.audio_path, self.aud_browse_btn, self.audio_preview, self.audio_method_combo,
+         self.audio_method_description, self.aud_analyze_btn) = self._build_media_controls(
+            "Audio", "Select WAV audio to analyze...", self.audio_window.browse_audio, "audioPreview",
+            (self.audio_preview_drag_enter_event, self.audio_preview_drag_leave_event,
+             self.audio_preview_drop_event),
+            ("Audio LSB Analysis", "Audio Chi-Square Test", "Audio Spectral Analysis",
+             "Audio Autocorrelation Analysis", "Audio Entropy Analysis", "Audio Comprehensive Analysis",
+             "Audio Advanced Comprehensive"),
+            self.audio_window,
+            self.audio_window.analyze_audio)
         return panel
 
     def _build_audio_results(self) -> QWidget:
@@ -1237,12 +668,7 @@ class SteganalysisWindow(QMainWindow):
         header_layout = QHBoxLayout()
         
         title = QLabel("Audio Analysis Results")
-        f = QFont()
-        f.setPointSize(20)
-        f.setBold(True)
-        title.setFont(f)
-        title.setStyleSheet(
-            "color: #e8e8fc; margin-bottom: 10px; border: none;")
+        title.setObjectName("panelTitle")
         
         # Add spacer to push sensitivity to the right
         header_layout.addWidget(title)
@@ -1250,22 +676,7 @@ class SteganalysisWindow(QMainWindow):
         
         # Create narrow sensitivity level control with border and label
         sensitivity_group = QGroupBox("Sensitivity")
-        sensitivity_group.setStyleSheet("""
-            QGroupBox {
-                color: #e8e8fc;
-                font-weight: bold;
-                font-size: 12px;
-                border: 2px solid rgba(69,237,242,0.6);
-                border-radius: 8px;
-                margin-top: 5px;
-                padding-top: 5px;
-            }
-            QGroupBox::title {
-                subcontrol-origin: margin;
-                left: 8px;
-                padding: 0 3px 0 3px;
-            }
-        """)
+        sensitivity_group.setObjectName("sensitivityGroup")
         sensitivity_layout = QVBoxLayout(sensitivity_group)
         sensitivity_layout.setContentsMargins(8, 5, 8, 8)
         
@@ -1277,143 +688,33 @@ class SteganalysisWindow(QMainWindow):
         ])
         self.audio_sensitivity_combo.setCurrentIndex(0)  # Default to Ultra
         self.audio_sensitivity_combo.setMaximumWidth(140)  # Make it narrow
-        self.audio_sensitivity_combo.setStyleSheet("""
-            QComboBox {
-                background-color: #0e1625;
-                color: #e8e8fc;
-                border: 2px solid rgba(69,237,242,0.6);
-                border-radius: 6px;
-                padding: 4px;
-                font-size: 11px;
-            }
-            QComboBox:focus {
-                border: 3px solid rgba(69,237,242,1.0);
-            }
-            QComboBox::drop-down {
-                border: none;
-            }
-            QComboBox::down-arrow {
-                image: none;
-                border-left: 3px solid transparent;
-                border-right: 3px solid transparent;
-                border-top: 3px solid #45edf2;
-                margin-right: 6px;
-            }
-            QComboBox QAbstractItemView {
-                background-color: #0e1625;
-                color: #e8e8fc;
-                border: 2px solid rgba(69,237,242,0.6);
-                selection-background-color: rgba(69,237,242,0.3);
-            }
-        """)
+        self.audio_sensitivity_combo.setObjectName("sensitivityCombo")
         sensitivity_layout.addWidget(self.audio_sensitivity_combo)
         
         header_layout.addWidget(sensitivity_group)
 
         self.aud_progress_bar = QProgressBar()
         self.aud_progress_bar.setVisible(False)
-        self.aud_progress_bar.setStyleSheet("""
-            QProgressBar { 
-                border: 2px solid rgba(69,237,242,0.6); 
-                border-radius: 8px; 
-                text-align: center; 
-                background-color: #0e1625;
-                color: #e8e8fc;
-            }
-            QProgressBar::chunk { 
-                background-color: #45edf2; 
-                border-radius: 6px; 
-            }
-        """)
+        self.aud_progress_bar.setObjectName("analysisProgress")
 
         aud_results_group = QGroupBox("Detection Results")
-        aud_results_group.setStyleSheet("""
-            QGroupBox {
-                color: #e8e8fc;
-                font-weight: bold;
-                font-size: 16px;
-                border: 2px solid rgba(69,237,242,0.6);
-                border-radius: 10px;
-                margin-top: 10px;
-                padding-top: 10px;
-            }
-            QGroupBox::title {
-                subcontrol-origin: margin;
-                left: 10px;
-                padding: 0 5px 0 5px;
-            }
-        """)
+        aud_results_group.setObjectName("sectionGroup")
         aud_results_layout = QVBoxLayout(aud_results_group)
         self.aud_results_text = QTextEdit()
         self.aud_results_text.setReadOnly(True)
-        self.aud_results_text.setStyleSheet("""
-            QTextEdit {
-                background-color: #0e1625;
-                color: #e8e8fc;
-                border: 2px solid rgba(69,237,242,0.6);
-                border-radius: 8px;
-                padding: 8px;
-            }
-        """)
+        self.aud_results_text.setObjectName("resultsText")
         self.aud_results_text.setPlaceholderText(
             "Analysis results will appear here...")
         aud_results_layout.addWidget(self.aud_results_text)
 
         audio_charts_group = QGroupBox("Audio Charts")
-        audio_charts_group.setStyleSheet("""
-            QGroupBox {
-                color: #e8e8fc;
-                font-weight: bold;
-                font-size: 16px;
-                border: 2px solid rgba(69,237,242,0.6);
-                border-radius: 10px;
-                margin-top: 10px;
-                padding-top: 10px;
-            }
-            QGroupBox::title {
-                subcontrol-origin: margin;
-                left: 10px;
-                padding: 0 5px 0 5px;
-            }
-        """)
+        audio_charts_group.setObjectName("sectionGroup")
         # Create single scrollable area for all audio charts
         audio_charts_scroll = QScrollArea()
         audio_charts_scroll.setWidgetResizable(True)
         audio_charts_scroll.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAsNeeded)
         audio_charts_scroll.setVerticalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAsNeeded)
-        audio_charts_scroll.setStyleSheet("""
-            QScrollArea {
-                border: 2px solid rgba(69,237,242,0.6);
-                border-radius: 8px;
-                background-color: white;
-            }
-            QScrollBar:vertical {
-                background-color: rgba(69,237,242,0.2);
-                width: 12px;
-                border-radius: 6px;
-            }
-            QScrollBar::handle:vertical {
-                background-color: rgba(69,237,242,0.6);
-                border-radius: 6px;
-                min-height: 20px;
-            }
-            QScrollBar::handle:vertical:hover {
-                background-color: rgba(69,237,242,0.8);
-            }
-            QScrollBar:horizontal {
-                background-color: rgba(69,237,242,0.2);
-                height: 12px;
-                border-radius: 6px;
-            }
-            QScrollBar::handle:horizontal {
-                background-color: rgba(69,237,242,0.6);
-                border-radius: 6px;
-                min-width: 20px;
-            }
-            QScrollBar::handle:horizontal:hover {
-                background-color: rgba(69,237,242,0.8);
-            }
-        """)
+        audio_charts_scroll.setObjectName("chartsScroll")
         
         # Create container for vertical chart layout
         audio_charts_widget = QWidget()
@@ -1421,25 +722,9 @@ class SteganalysisWindow(QMainWindow):
         audio_charts_widget_layout.setSpacing(20)
         audio_charts_widget_layout.setContentsMargins(15, 15, 15, 15)
         
-        # Create canvases that fit container width (reduced width to prevent cutoff)
-        self.aud_canvas_wave = FigureCanvas(Figure(figsize=(8, 4), dpi=100))
-        self.aud_canvas_spec = FigureCanvas(Figure(figsize=(8, 4), dpi=100))
-        self.aud_canvas_entropy = FigureCanvas(Figure(figsize=(8, 4), dpi=100))
-        
-        # Set size policy to fit container width
-        self.aud_canvas_wave.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Fixed)
-        self.aud_canvas_spec.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Fixed)
-        self.aud_canvas_entropy.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Fixed)
-        
-        # Set fixed height but let width expand
-        self.aud_canvas_wave.setFixedHeight(400)
-        self.aud_canvas_spec.setFixedHeight(400)
-        self.aud_canvas_entropy.setFixedHeight(400)
-        
-        # Add charts vertically to the container
-        audio_charts_widget_layout.addWidget(self.aud_canvas_wave)
-        audio_charts_widget_layout.addWidget(self.aud_canvas_spec)
-        audio_charts_widget_layout.addWidget(self.aud_canvas_entropy)
+        # Chart canvases are only built on the first analysis (ensure_audio_charts)
+        self.aud_charts_layout = audio_charts_widget_layout
+        self.aud_canvas_wave = self.aud_canvas_spec = self.aud_canvas_entropy = None
         audio_charts_widget_layout.addStretch()  # Add stretch to push charts to top
         
         # Set the charts widget as the scroll area's widget
@@ -1450,35 +735,12 @@ class SteganalysisWindow(QMainWindow):
         audio_charts_layout.addWidget(audio_charts_scroll)
 
         aud_stats_group = QGroupBox("Statistics")
-        aud_stats_group.setStyleSheet("""
-            QGroupBox {
-                color: #e8e8fc;
-                font-weight: bold;
-                font-size: 16px;
-                border: 2px solid rgba(69,237,242,0.6);
-                border-radius: 10px;
-                margin-top: 10px;
-                padding-top: 10px;
-            }
-            QGroupBox::title {
-                subcontrol-origin: margin;
-                left: 10px;
-                padding: 0 5px 0 5px;
-            }
-        """)
+        aud_stats_group.setObjectName("sectionGroup")
         aud_stats_layout = QVBoxLayout(aud_stats_group)
         self.aud_stats_text = QTextEdit()
         self.aud_stats_text.setReadOnly(True)
         self.aud_stats_text.setMaximumHeight(150)
-        self.aud_stats_text.setStyleSheet("""
-            QTextEdit {
-                background-color: #0e1625;
-                color: #e8e8fc;
-                border: 2px solid rgba(69,237,242,0.6);
-                border-radius: 8px;
-                padding: 8px;
-            }
-        """)
+        self.aud_stats_text.setObjectName("resultsText")
         self.aud_stats_text.setPlaceholderText(
             "Audio statistics will appear here...")
         aud_stats_layout.addWidget(self.aud_stats_text)
@@ -1488,41 +750,11 @@ class SteganalysisWindow(QMainWindow):
         export_buttons_layout.setSpacing(10)
         
         export_aud_pdf_btn = QPushButton("Export Charts to PDF")
-        export_aud_pdf_btn.setStyleSheet("""
-            QPushButton { 
-                background: rgba(147,51,234,0.2);
-                color: #9333ea;
-                border: 2px solid #9333ea;
-                padding: 10px 20px;
-                border-radius: 8px;
-                font-weight: bold;
-                font-size: 14px;
-            }
-            QPushButton:hover { 
-                background: rgba(147,51,234,0.4);
-                border: 3px solid #9333ea;
-                color: #ffffff;
-            }
-        """)
+        export_aud_pdf_btn.setObjectName("exportButton")
         export_aud_pdf_btn.clicked.connect(self.export_charts_pdf)
 
         export_button = QPushButton("Export Report")
-        export_button.setStyleSheet("""
-            QPushButton { 
-                background: rgba(147,51,234,0.2);
-                color: #9333ea;
-                border: 2px solid #9333ea;
-                padding: 10px 20px;
-                border-radius: 8px;
-                font-weight: bold;
-                font-size: 14px;
-            }
-            QPushButton:hover { 
-                background: rgba(147,51,234,0.4);
-                border: 3px solid #9333ea;
-                color: #ffffff;
-            }
-        """)
+        export_button.setObjectName("exportButton")
         export_button.clicked.connect(self.export_report)
         
         export_buttons_layout.addWidget(export_aud_pdf_btn)
@@ -1567,229 +799,15 @@ class SteganalysisWindow(QMainWindow):
         return panel
 
     def _build_video_controls(self) -> QWidget:
-        panel = self._styled_panel()
-        layout = QVBoxLayout(panel)
-        layout.setSpacing(20)
-        layout.setContentsMargins(30, 30, 30, 30)
-
-        title = QLabel("Video Analysis Input")
-        f = QFont()
-        f.setPointSize(20)
-        f.setBold(True)
-        title.setFont(f)
-        title.setStyleSheet(
-            "color: #e8e8fc; margin-bottom: 10px; border: none;")
-
-        video_group = QGroupBox("Suspicious Video")
-        video_group.setStyleSheet("""
-            QGroupBox {
-                color: #e8e8fc;
-                font-weight: bold;
-                font-size: 16px;
-                border: 2px solid rgba(69,237,242,0.6);
-                border-radius: 10px;
-                margin-top: 10px;
-                padding-top: 10px;
-            }
-            QGroupBox::title {
-                subcontrol-origin: margin;
-                left: 10px;
-                padding: 0 5px 0 5px;
-            }
-        """)
-        video_layout = QVBoxLayout(video_group)
-        self.video_path = QLineEdit()
-        self.video_path.setPlaceholderText("Select video to analyze...")
-        self.video_path.setReadOnly(True)
-        self.video_path.setStyleSheet("""
-            QLineEdit {
-                background-color: #0e1625;
-                color: #e8e8fc;
-                border: 2px solid rgba(69,237,242,0.6);
-                border-radius: 8px;
-                padding: 8px;
-            }
-            QLineEdit:focus {
-                border: 3px solid rgba(69,237,242,1.0);
-            }
-        """)
-        browse_video_button = QPushButton("Browse Video")
-        browse_video_button.setStyleSheet("""
-            QPushButton { 
-                background: rgba(34,139,34,0.2);
-                color: #22c55e;
-                border: 2px solid #22c55e;
-                padding: 8px 16px;
-                border-radius: 8px;
-                font-weight: bold;
-                font-size: 14px;
-            }
-            QPushButton:hover { 
-                background: rgba(34,139,34,0.4);
-                border: 3px solid #22c55e;
-                color: #ffffff;
-            }
-        """)
-        browse_video_button.clicked.connect(self.video_window.browse_video)
-        video_layout.addWidget(self.video_path)
-        video_layout.addWidget(browse_video_button)
-
-        # Video preview
-        self.video_preview = QLabel()
-        self.video_preview.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        self.video_preview.setStyleSheet("""
-            QLabel {
-                border: 2px solid rgba(69,237,242,0.6);
-                border-radius: 8px;
-                background-color: #0e1625;
-                color: #e8e8fc;
-                min-height: 120px;
-                max-height: 180px;
-            }
-        """)
-        self.video_preview.setSizePolicy(
-            QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Fixed)
-        self.video_preview.setText("No video selected")
-        self.video_preview.setScaledContents(False)
-        self.video_preview.setAcceptDrops(True)  # Enable drag and drop directly on the preview
-        # Connect drag and drop events
-        self.video_preview.dragEnterEvent = self.video_preview_drag_enter_event
-        self.video_preview.dragLeaveEvent = self.video_preview_drag_leave_event
-        self.video_preview.dropEvent = self.video_preview_drop_event
-        video_layout.addWidget(self.video_preview)
-
-        video_method_group = QGroupBox("Video Analysis Method")
-        video_method_group.setStyleSheet("""
-            QGroupBox {
-                color: #e8e8fc;
-                font-weight: bold;
-                font-size: 16px;
-                border: 2px solid rgba(69,237,242,0.6);
-                border-radius: 10px;
-                margin-top: 10px;
-                padding-top: 10px;
-            }
-            QGroupBox::title {
-                subcontrol-origin: margin;
-                left: 10px;
-                padding: 0 5px 0 5px;
-            }
-        """)
-
-        video_method_group = QGroupBox("Video Analysis Method")
-        video_method_group.setStyleSheet("""
-            QGroupBox {
-                color: #e8e8fc;
-                font-weight: bold;
-                font-size: 16px;
-                border: 2px solid rgba(69,237,242,0.6);
-                border-radius: 10px;
-                margin-top: 10px;
-                padding-top: 10px;
-            }
-            QGroupBox::title {
-                subcontrol-origin: margin;
-                left: 10px;
-                padding: 0 5px 0 5px;
-            }
-        """)
-        video_method_layout = QVBoxLayout(video_method_group)
-        self.video_method_combo = QComboBox()
-        self.video_method_combo.addItems([
-            "Video LSB Analysis", "Video Frame Analysis", "Video Motion Analysis",
-            "Video Advanced Comprehensive"
-        ])
-        self.video_method_combo.setStyleSheet("""
-            QComboBox { 
-                padding: 8px 12px 8px 12px; 
-                border: 2px solid #45edf2; 
-                border-radius: 8px; 
-                background-color: #0e1625;
-                color: #e8e8fc;
-                font-weight: bold;
-            }
-            QComboBox:focus { 
-                border: 3px solid #45edf2;
-                background-color: rgba(69,237,242,0.1);
-            }
-            QComboBox::drop-down {
-                subcontrol-origin: padding;
-                subcontrol-position: top right;
-                width: 30px;
-                border-left: 2px solid #45edf2;
-                border-top-right-radius: 8px;
-                border-bottom-right-radius: 8px;
-                background-color: #45edf2;
-            }
-            QComboBox::down-arrow {
-                image: none;
-                border: none;
-                width: 0;
-                height: 0;
-                border-left: 5px solid transparent;
-                border-right: 5px solid transparent;
-                border-top: 6px solid #0e1625;
-                margin: 0 8px;
-            }
-            QComboBox QAbstractItemView {
-                border: 2px solid #45edf2;
-                border-radius: 8px;
-                background-color: #0e1625;
-                color: #e8e8fc;
-                selection-background-color: rgba(69,237,242,0.3);
-            }
-        """)
-        self.video_method_combo.currentTextChanged.connect(
-            self.video_window.on_video_method_changed)
-        video_method_layout.addWidget(self.video_method_combo)
-
-        # Method description
-        self.video_method_description = QLabel()
-        self.video_method_description.setWordWrap(True)
-        self.video_method_description.setStyleSheet("""
-            QLabel {
-                background-color: #0e1625;
-                border: 2px solid rgba(69,237,242,0.6);
-                border-radius: 8px;
-                padding: 10px;
-                font-size: 12px;
-                color: #e8e8fc;
-                min-height: 60px;
-            }
-        """)
-        # Initialize with Video LSB Analysis description
-        self.video_window.update_method_description(
-            "Video LSB Analysis", self.video_method_description)
-
-
-        self.vid_analyze_btn = QPushButton("Analyze Video")
-        self.vid_analyze_btn.setStyleSheet("""
-            QPushButton { 
-                background: rgba(255,140,0,0.2);
-                color: #ff8c00;
-                border: 2px solid #ff8c00;
-                padding: 12px 24px;
-                border-radius: 12px;
-                font-size: 14px;
-                font-weight: bold;
-            }
-            QPushButton:hover { 
-                background: rgba(255,140,0,0.4);
-                border: 3px solid #ff8c00;
-                color: #ffffff;
-            }
-            QPushButton:pressed {
-                background: rgba(255,140,0,0.4);
-            }
-        """)
-        self.vid_analyze_btn.clicked.connect(self.video_window.analyze_video)
-
-        layout.addWidget(title)
-        layout.addWidget(video_group)
-        layout.addWidget(video_method_group)
-        layout.addWidget(self.video_method_description)
-        layout.addWidget(self.vid_analyze_btn)
-        layout.addStretch()
+        (panel, self.video_path, self.vid_browse_btn, self.video_preview, self.video_method_combo,
+         self.video_method_description, self.vid_analyze_btn) = self._build_media_controls(
+            "Video", "Select video to analyze...", self.video_window.browse_video, "videoPreview",
+            (self.video_preview_drag_enter_event, self.video_preview_drag_leave_event,
+             self.video_preview_drop_event),
+            ("Video LSB Analysis", "Video Frame Analysis", "Video Motion Analysis",
+             "Video Advanced Comprehensive"),
+            self.video_window,
+            self.video_window.analyze_video)
         return panel
 
     def _build_video_results(self) -> QWidget:
@@ -1802,12 +820,7 @@ class SteganalysisWindow(QMainWindow):
         header_layout = QHBoxLayout()
         
         title = QLabel("Video Analysis Results")
-        f = QFont()
-        f.setPointSize(20)
-        f.setBold(True)
-        title.setFont(f)
-        title.setStyleSheet(
-            "color: #e8e8fc; margin-bottom: 10px; border: none;")
+        title.setObjectName("panelTitle")
         
         # Add spacer to push sensitivity to the right
         header_layout.addWidget(title)
@@ -1815,22 +828,7 @@ class SteganalysisWindow(QMainWindow):
         
         # Create narrow sensitivity level control with border and label
         sensitivity_group = QGroupBox("Sensitivity")
-        sensitivity_group.setStyleSheet("""
-            QGroupBox {
-                color: #e8e8fc;
-                font-weight: bold;
-                font-size: 12px;
-                border: 2px solid rgba(69,237,242,0.6);
-                border-radius: 8px;
-                margin-top: 5px;
-                padding-top: 5px;
-            }
-            QGroupBox::title {
-                subcontrol-origin: margin;
-                left: 8px;
-                padding: 0 3px 0 3px;
-            }
-        """)
+        sensitivity_group.setObjectName("sensitivityGroup")
         sensitivity_layout = QVBoxLayout(sensitivity_group)
         sensitivity_layout.setContentsMargins(8, 5, 8, 8)
         
@@ -1842,144 +840,34 @@ class SteganalysisWindow(QMainWindow):
         ])
         self.video_sensitivity_combo.setCurrentIndex(0)  # Default to Ultra
         self.video_sensitivity_combo.setMaximumWidth(140)  # Make it narrow
-        self.video_sensitivity_combo.setStyleSheet("""
-            QComboBox {
-                background-color: #0e1625;
-                color: #e8e8fc;
-                border: 2px solid rgba(69,237,242,0.6);
-                border-radius: 6px;
-                padding: 4px;
-                font-size: 11px;
-            }
-            QComboBox:focus {
-                border: 3px solid rgba(69,237,242,1.0);
-            }
-            QComboBox::drop-down {
-                border: none;
-            }
-            QComboBox::down-arrow {
-                image: none;
-                border-left: 3px solid transparent;
-                border-right: 3px solid transparent;
-                border-top: 3px solid #45edf2;
-                margin-right: 6px;
-            }
-            QComboBox QAbstractItemView {
-                background-color: #0e1625;
-                color: #e8e8fc;
-                border: 2px solid rgba(69,237,242,0.6);
-                selection-background-color: rgba(69,237,242,0.3);
-            }
-        """)
+        self.video_sensitivity_combo.setObjectName("sensitivityCombo")
         sensitivity_layout.addWidget(self.video_sensitivity_combo)
         
         header_layout.addWidget(sensitivity_group)
 
         self.vid_progress_bar = QProgressBar()
         self.vid_progress_bar.setVisible(False)
-        self.vid_progress_bar.setStyleSheet("""
-            QProgressBar { 
-                border: 2px solid rgba(69,237,242,0.6); 
-                border-radius: 8px; 
-                text-align: center; 
-                background-color: #0e1625;
-                color: #e8e8fc;
-            }
-            QProgressBar::chunk { 
-                background-color: #45edf2; 
-                border-radius: 6px; 
-            }
-        """)
+        self.vid_progress_bar.setObjectName("analysisProgress")
 
         vid_results_group = QGroupBox("Detection Results")
-        vid_results_group.setStyleSheet("""
-            QGroupBox {
-                color: #e8e8fc;
-                font-weight: bold;
-                font-size: 16px;
-                border: 2px solid rgba(69,237,242,0.6);
-                border-radius: 10px;
-                margin-top: 10px;
-                padding-top: 10px;
-            }
-            QGroupBox::title {
-                subcontrol-origin: margin;
-                left: 10px;
-                padding: 0 5px 0 5px;
-            }
-        """)
+        vid_results_group.setObjectName("sectionGroup")
         vid_results_layout = QVBoxLayout(vid_results_group)
         self.vid_results_text = QTextEdit()
         self.vid_results_text.setReadOnly(True)
-        self.vid_results_text.setStyleSheet("""
-            QTextEdit {
-                background-color: #0e1625;
-                color: #e8e8fc;
-                border: 2px solid rgba(69,237,242,0.6);
-                border-radius: 8px;
-                padding: 8px;
-            }
-        """)
+        self.vid_results_text.setObjectName("resultsText")
         self.vid_results_text.setPlaceholderText(
             "Analysis results will appear here...")
         vid_results_layout.addWidget(self.vid_results_text)
 
         # Video charts
         video_charts_group = QGroupBox("Video Charts")
-        video_charts_group.setStyleSheet("""
-            QGroupBox {
-                color: #e8e8fc;
-                font-weight: bold;
-                font-size: 16px;
-                border: 2px solid rgba(69,237,242,0.6);
-                border-radius: 10px;
-                margin-top: 10px;
-                padding-top: 10px;
-            }
-            QGroupBox::title {
-                subcontrol-origin: margin;
-                left: 10px;
-                padding: 0 5px 0 5px;
-            }
-        """)
+        video_charts_group.setObjectName("sectionGroup")
         # Create single scrollable area for all video charts
         video_charts_scroll = QScrollArea()
         video_charts_scroll.setWidgetResizable(True)
         video_charts_scroll.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAsNeeded)
         video_charts_scroll.setVerticalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAsNeeded)
-        video_charts_scroll.setStyleSheet("""
-            QScrollArea {
-                border: 2px solid rgba(69,237,242,0.6);
-                border-radius: 8px;
-                background-color: white;
-            }
-            QScrollBar:vertical {
-                background-color: rgba(69,237,242,0.2);
-                width: 12px;
-                border-radius: 6px;
-            }
-            QScrollBar::handle:vertical {
-                background-color: rgba(69,237,242,0.6);
-                border-radius: 6px;
-                min-height: 20px;
-            }
-            QScrollBar::handle:vertical:hover {
-                background-color: rgba(69,237,242,0.8);
-            }
-            QScrollBar:horizontal {
-                background-color: rgba(69,237,242,0.2);
-                height: 12px;
-                border-radius: 6px;
-            }
-            QScrollBar::handle:horizontal {
-                background-color: rgba(69,237,242,0.6);
-                border-radius: 6px;
-                min-width: 20px;
-            }
-            QScrollBar::handle:horizontal:hover {
-                background-color: rgba(69,237,242,0.8);
-            }
-        """)
+        video_charts_scroll.setObjectName("chartsScroll")
         
         # Create container for vertical chart layout
         video_charts_widget = QWidget()
@@ -1987,25 +875,9 @@ class SteganalysisWindow(QMainWindow):
         video_charts_widget_layout.setSpacing(20)
         video_charts_widget_layout.setContentsMargins(15, 15, 15, 15)
         
-        # Create canvases that fit container width
-        self.vid_canvas_frame = FigureCanvas(Figure(figsize=(10, 4), dpi=100))
-        self.vid_canvas_motion = FigureCanvas(Figure(figsize=(10, 4), dpi=100))
-        self.vid_canvas_lsb = FigureCanvas(Figure(figsize=(10, 4), dpi=100))
-        
-        # Set size policy to fit container width
-        self.vid_canvas_frame.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Fixed)
-        self.vid_canvas_motion.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Fixed)
-        self.vid_canvas_lsb.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Fixed)
-        
-        # Set fixed height but let width expand
-        self.vid_canvas_frame.setFixedHeight(400)
-        self.vid_canvas_motion.setFixedHeight(400)
-        self.vid_canvas_lsb.setFixedHeight(400)
-        
-        # Add charts vertically to the container
-        video_charts_widget_layout.addWidget(self.vid_canvas_frame)
-        video_charts_widget_layout.addWidget(self.vid_canvas_motion)
-        video_charts_widget_layout.addWidget(self.vid_canvas_lsb)
+        # Chart canvases are only built on the first analysis (ensure_video_charts)
+        self.vid_charts_layout = video_charts_widget_layout
+        self.vid_canvas_frame = self.vid_canvas_motion = self.vid_canvas_lsb = None
         video_charts_widget_layout.addStretch()  # Add stretch to push charts to top
         
         # Set the charts widget as the scroll area's widget
@@ -2016,35 +888,12 @@ class SteganalysisWindow(QMainWindow):
         video_charts_layout.addWidget(video_charts_scroll)
 
         vid_stats_group = QGroupBox("Statistics")
-        vid_stats_group.setStyleSheet("""
-            QGroupBox {
-                color: #e8e8fc;
-                font-weight: bold;
-                font-size: 16px;
-                border: 2px solid rgba(69,237,242,0.6);
-                border-radius: 10px;
-                margin-top: 10px;
-                padding-top: 10px;
-            }
-            QGroupBox::title {
-                subcontrol-origin: margin;
-                left: 10px;
-                padding: 0 5px 0 5px;
-            }
-        """)
+        vid_stats_group.setObjectName("sectionGroup")
         vid_stats_layout = QVBoxLayout(vid_stats_group)
         self.vid_stats_text = QTextEdit()
         self.vid_stats_text.setReadOnly(True)
         self.vid_stats_text.setMaximumHeight(150)
-        self.vid_stats_text.setStyleSheet("""
-            QTextEdit {
-                background-color: #0e1625;
-                color: #e8e8fc;
-                border: 2px solid rgba(69,237,242,0.6);
-                border-radius: 8px;
-                padding: 8px;
-            }
-        """)
+        self.vid_stats_text.setObjectName("resultsText")
         self.vid_stats_text.setPlaceholderText(
             "Video statistics will appear here...")
         vid_stats_layout.addWidget(self.vid_stats_text)
@@ -2054,41 +903,11 @@ class SteganalysisWindow(QMainWindow):
         export_buttons_layout.setSpacing(10)
         
         export_vid_pdf_btn = QPushButton("Export Charts to PDF")
-        export_vid_pdf_btn.setStyleSheet("""
-            QPushButton { 
-                background: rgba(147,51,234,0.2);
-                color: #9333ea;
-                border: 2px solid #9333ea;
-                padding: 10px 20px;
-                border-radius: 8px;
-                font-weight: bold;
-                font-size: 14px;
-            }
-            QPushButton:hover { 
-                background: rgba(147,51,234,0.4);
-                border: 3px solid #9333ea;
-                color: #ffffff;
-            }
-        """)
+        export_vid_pdf_btn.setObjectName("exportButton")
         export_vid_pdf_btn.clicked.connect(self.export_charts_pdf)
 
         export_vid_report_btn = QPushButton("Export Report")
-        export_vid_report_btn.setStyleSheet("""
-            QPushButton { 
-                background: rgba(147,51,234,0.2);
-                color: #9333ea;
-                border: 2px solid #9333ea;
-                padding: 10px 20px;
-                border-radius: 8px;
-                font-weight: bold;
-                font-size: 14px;
-            }
-            QPushButton:hover { 
-                background: rgba(147,51,234,0.4);
-                border: 3px solid #9333ea;
-                color: #ffffff;
-            }
-        """)
+        export_vid_report_btn.setObjectName("exportButton")
         export_vid_report_btn.clicked.connect(self.export_report)
         
         export_buttons_layout.addWidget(export_vid_pdf_btn)
@@ -2135,25 +954,6 @@ class SteganalysisWindow(QMainWindow):
         
         return panel
 
-
-    def create_shadow_effect(self):
-        """Create an enhanced shadow effect for panels"""
-        from PyQt6.QtWidgets import QGraphicsDropShadowEffect
-        shadow = QGraphicsDropShadowEffect()
-        shadow.setBlurRadius(35)  # Increased blur for stronger glow
-        shadow.setXOffset(0)
-        shadow.setYOffset(8)  # Increased offset for more depth
-        # Enhanced cyan glow with higher opacity
-        # Doubled opacity for stronger effect
-        shadow.setColor(QColor(69, 237, 242, 80))
-        return shadow
-
-    def update_method_description(self, method_name: str, description_widget: QLabel):
-        """Update the method description based on selected method"""
-        description = self.method_descriptions.get(
-            method_name, "No description available for this method.")
-        description_widget.setText(description)
-
     def get_sensitivity_level(self, media_type: str) -> str:
         """Get the selected sensitivity level for the specified media type"""
         if media_type == "image":
@@ -2175,6 +975,23 @@ class SteganalysisWindow(QMainWindow):
         else:
             return "ultra"  # Default fallback
 
+    def set_analysis_inputs_enabled(self, enabled: bool):
+        """Enable or disable Browse, drop, Analyze and Back on every tab.
+
+        The image, audio and video workers all share one SteganalysisMachine
+        (its loaded files, sensitivity level and last analyzed path), so while
+        any of them runs no tab may load a file or start another analysis, and
+        the window may not be left (go_back cleans the machine up).
+        """
+        for browse_button, preview, analyze_button in (
+                (self.img_browse_btn, self.image_preview, self.img_analyze_btn),
+                (self.aud_browse_btn, self.audio_preview, self.aud_analyze_btn),
+                (self.vid_browse_btn, self.video_preview, self.vid_analyze_btn)):
+            browse_button.setEnabled(enabled)
+            preview.setAcceptDrops(enabled)
+            analyze_button.setEnabled(enabled)
+        self.back_button.setEnabled(enabled)
+
     def export_report(self):
         """Export analysis report"""
         # Generate timestamp string
@@ -2194,6 +1011,12 @@ class SteganalysisWindow(QMainWindow):
                 # Export failed - could show error message in appropriate tab
                 pass
 
+    def _set_drop_highlight(self, preview: QLabel, active: bool):
+        """Toggle the dashed drop-target look defined in the stylesheet"""
+        preview.setProperty("dropActive", active)
+        preview.style().unpolish(preview)
+        preview.style().polish(preview)
+
     def on_image_files_dropped(self, file_paths):
         """Handle dropped image files"""
         if file_paths:
@@ -2219,16 +1042,7 @@ class SteganalysisWindow(QMainWindow):
                         event.acceptProposedAction()
                         # Change text and add visual feedback
                         self.image_preview.setText("Drop here!")
-                        self.image_preview.setStyleSheet("""
-                            QLabel {
-                                border: 4px dashed #45edf2;
-                                border-radius: 8px;
-                                background-color: rgba(69,237,242,0.4);
-                                color: #e8e8fc;
-                                min-height: 150px;
-                                max-height: 200px;
-                            }
-                        """)
+                        self._set_drop_highlight(self.image_preview, True)
                         return
         event.ignore()
 
@@ -2236,31 +1050,13 @@ class SteganalysisWindow(QMainWindow):
         """Handle drag leave event for image preview"""
         # Restore original text and remove visual feedback
         self.image_preview.setText("No image selected")
-        self.image_preview.setStyleSheet("""
-            QLabel {
-                border: 2px solid rgba(69,237,242,0.6);
-                border-radius: 8px;
-                background-color: #0e1625;
-                color: #e8e8fc;
-                min-height: 150px;
-                max-height: 200px;
-            }
-        """)
+        self._set_drop_highlight(self.image_preview, False)
         event.accept()
 
     def image_preview_drop_event(self, event):
         """Handle drop event for image preview"""
         # Remove visual feedback
-        self.image_preview.setStyleSheet("""
-            QLabel {
-                border: 2px solid rgba(69,237,242,0.6);
-                border-radius: 8px;
-                background-color: #0e1625;
-                color: #e8e8fc;
-                min-height: 150px;
-                max-height: 200px;
-            }
-        """)
+        self._set_drop_highlight(self.image_preview, False)
         
         if event.mimeData().hasUrls():
             urls = event.mimeData().urls()
@@ -2305,16 +1101,7 @@ class SteganalysisWindow(QMainWindow):
                         event.acceptProposedAction()
                         # Change text and add visual feedback
                         self.audio_preview.setText("Drop here!")
-                        self.audio_preview.setStyleSheet("""
-                            QLabel {
-                                border: 4px dashed #45edf2;
-                                border-radius: 8px;
-                                background-color: rgba(69,237,242,0.4);
-                                color: #e8e8fc;
-                                min-height: 100px;
-                                max-height: 150px;
-                            }
-                        """)
+                        self._set_drop_highlight(self.audio_preview, True)
                         return
         event.ignore()
 
@@ -2322,31 +1109,13 @@ class SteganalysisWindow(QMainWindow):
         """Handle drag leave event for audio preview"""
         # Restore original text and remove visual feedback
         self.audio_preview.setText("No audio selected")
-        self.audio_preview.setStyleSheet("""
-            QLabel {
-                border: 2px solid rgba(69,237,242,0.6);
-                border-radius: 8px;
-                background-color: #0e1625;
-                color: #e8e8fc;
-                min-height: 100px;
-                max-height: 150px;
-            }
-        """)
+        self._set_drop_highlight(self.audio_preview, False)
         event.accept()
 
     def audio_preview_drop_event(self, event):
         """Handle drop event for audio preview"""
         # Remove visual feedback
-        self.audio_preview.setStyleSheet("""
-            QLabel {
-                border: 2px solid rgba(69,237,242,0.6);
-                border-radius: 8px;
-                background-color: #0e1625;
-                color: #e8e8fc;
-                min-height: 100px;
-                max-height: 150px;
-            }
-        """)
+        self._set_drop_highlight(self.audio_preview, False)
         
         if event.mimeData().hasUrls():
             urls = event.mimeData().urls()
@@ -2391,16 +1160,7 @@ class SteganalysisWindow(QMainWindow):
                         event.acceptProposedAction()
                         # Change text and add visual feedback
                         self.video_preview.setText("Drop here!")
-                        self.video_preview.setStyleSheet("""
-                            QLabel {
-                                border: 4px dashed #45edf2;
-                                border-radius: 8px;
-                                background-color: rgba(69,237,242,0.4);
-                                color: #e8e8fc;
-                                min-height: 120px;
-                                max-height: 180px;
-                            }
-                        """)
+                        self._set_drop_highlight(self.video_preview, True)
                         return
         event.ignore()
 
@@ -2408,31 +1168,13 @@ class SteganalysisWindow(QMainWindow):
         """Handle drag leave event for video preview"""
         # Restore original text and remove visual feedback
         self.video_preview.setText("No video selected")
-        self.video_preview.setStyleSheet("""
-            QLabel {
-                border: 2px solid rgba(69,237,242,0.6);
-                border-radius: 8px;
-                background-color: #0e1625;
-                color: #e8e8fc;
-                min-height: 120px;
-                max-height: 180px;
-            }
-        """)
+        self._set_drop_highlight(self.video_preview, False)
         event.accept()
 
     def video_preview_drop_event(self, event):
         """Handle drop event for video preview"""
         # Remove visual feedback
-        self.video_preview.setStyleSheet("""
-            QLabel {
-                border: 2px solid rgba(69,237,242,0.6);
-                border-radius: 8px;
-                background-color: #0e1625;
-                color: #e8e8fc;
-                min-height: 120px;
-                max-height: 180px;
-            }
-        """)
+        self._set_drop_highlight(self.video_preview, False)
         
         if event.mimeData().hasUrls():
             urls = event.mimeData().urls()
@@ -2452,13 +1194,13 @@ class SteganalysisWindow(QMainWindow):
         else:
             event.ignore()
 
-    def resizeEvent(self, event):
-        """Handle window resize events"""
-        super().resizeEvent(event)
-        # Drag and drop is now handled directly by preview widgets, no positioning needed
-
     def go_back(self):
         """Go back to main window"""
+        # Back is disabled while an analysis runs, but preview and export
+        # workers may still be going; let them finish before the machine's
+        # arrays are released
+        QThreadPool.globalInstance().waitForDone()
+
         # Clean up machine resources
         self.machine.cleanup()
 
@@ -2467,10 +1209,155 @@ class SteganalysisWindow(QMainWindow):
         self.main_window.show()
         self.close()
 
+    # ======== Chart canvases (built on first analysis) ========
+
+    @staticmethod
+    def _add_chart_canvases(layout: QVBoxLayout, count: int, figsize) -> list:
+        """Create fixed-height chart canvases and insert them above the layout's stretch"""
+        # matplotlib's Qt backend is only loaded once a chart is drawn
+        from matplotlib.backends.backend_qtagg import FigureCanvasQTAgg as FigureCanvas
+        from matplotlib.figure import Figure
+
+        canvases = []
+        for _ in range(count):
+            canvas = FigureCanvas(Figure(figsize=figsize, dpi=100))
+            # Fit the container width, fixed height
+            canvas.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Fixed)
+            canvas.setFixedHeight(400)
+            layout.insertWidget(layout.count() - 1, canvas)
+            canvases.append(canvas)
+        return canvases
+
+    def ensure_image_charts(self):
+        """Build the LSB, difference and histogram panels on first use"""
+        if self.img_view_lsb is not None:
+            return
+        # The LSB plane and difference map are already display-ready uint8 maps,
+        # so they are shown as plain QImages instead of going through imshow
+        self.img_view_lsb = ChartImageView('LSB Plane')
+        self.img_view_diff = ChartImageView('Difference Map')
+        for view in (self.img_view_lsb, self.img_view_diff):
+            view.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Fixed)
+            view.setFixedHeight(400)
+            self.img_charts_layout.insertWidget(self.img_charts_layout.count() - 1, view)
+        self.img_canvas_hist, = self._add_chart_canvases(self.img_charts_layout, 1, (10, 4))
+
+        # Histogram axes and lines are created once; analyses only swap the data
+        self.img_hist_ax = self.img_canvas_hist.figure.add_subplot(111)
+        self.img_canvas_hist.figure.subplots_adjust(left=0.1, right=0.95, top=0.9, bottom=0.1)
+        self.img_hist_lines = [
+            self.img_hist_ax.plot(np.zeros(256), color=c, label=f'Channel {c.upper()}')[0]
+            for c in ('r', 'g', 'b')
+        ]
+        self.img_hist_ax.set_title('Histogram', fontsize=12)
+        self.img_hist_ax.set_xlabel('Pixel value', fontsize=10)
+        self.img_hist_ax.set_ylabel('Count', fontsize=10)
+        self.img_hist_ax.set_xlim(0, 255)
+        self.img_hist_ax.legend(loc='upper right', fontsize=9)
+        self.img_hist_ax.grid(True, alpha=0.2)
+
+    def ensure_audio_charts(self):
+        """Build the waveform, spectrogram and entropy canvases on first use"""
+        if self.aud_canvas_wave is not None:
+            return
+        # Reduced width to prevent cutoff
+        self.aud_canvas_wave, self.aud_canvas_spec, self.aud_canvas_entropy = \
+            self._add_chart_canvases(self.aud_charts_layout, 3, (8, 4))
+
+        # Waveform and entropy are persistent lines; analyses only swap their data
+        self.aud_wave_ax = self.aud_canvas_wave.figure.add_subplot(111)
+        self.aud_canvas_wave.figure.subplots_adjust(left=0.1, right=0.95, top=0.9, bottom=0.1)
+        self.aud_wave_line, = self.aud_wave_ax.plot([], [], color='#34495e', linewidth=0.8)
+        self.aud_wave_ax.set_title('Waveform')
+        self.aud_wave_ax.set_xlabel('Time (s)')
+        self.aud_wave_ax.set_ylabel('Amplitude')
+        self.aud_wave_ax.grid(True, alpha=0.2)
+
+        self.aud_ent_ax = self.aud_canvas_entropy.figure.add_subplot(111)
+        self.aud_canvas_entropy.figure.subplots_adjust(left=0.1, right=0.95, top=0.9, bottom=0.1)
+        self.aud_ent_line, = self.aud_ent_ax.plot([], [], color='#8e44ad', linewidth=1.2)
+        self.aud_ent_ax.set_title('Short-time Entropy')
+        self.aud_ent_ax.set_xlabel('Time (s)')
+        self.aud_ent_ax.set_ylabel('Entropy (bits)')
+        self.aud_ent_ax.grid(True, alpha=0.2)
+
+        # Spectrogram is a single float32 image; analyses only swap its data
+        self.aud_spec_ax = self.aud_canvas_spec.figure.add_subplot(111)
+        self.aud_canvas_spec.figure.subplots_adjust(left=0.1, right=0.95, top=0.9, bottom=0.1)
+        self.aud_spec_image = self.aud_spec_ax.imshow(
+            np.zeros((2, 2), dtype=np.float32), cmap='magma', origin='lower',
+            aspect='auto', interpolation='nearest')
+        self.aud_spec_ax.set_title('Spectrogram')
+        self.aud_spec_ax.set_xlabel('Time (s)')
+        self.aud_spec_ax.set_ylabel('Frequency (Hz)')
+
+    def ensure_video_charts(self):
+        """Build the frame, motion and LSB canvases on first use"""
+        if self.vid_canvas_frame is not None:
+            return
+        self.vid_canvas_frame, self.vid_canvas_motion, self.vid_canvas_lsb = \
+            self._add_chart_canvases(self.vid_charts_layout, 3, (10, 4))
+        # Fixed margins, set once: re-analyses never re-run subplot layout
+        for canvas in (self.vid_canvas_frame, self.vid_canvas_motion, self.vid_canvas_lsb):
+            canvas.figure.subplots_adjust(left=0.1, right=0.95, top=0.9, bottom=0.1)
+
+        # Axes and lines are created once; analyses only swap their data
+        self.vid_frame_ax = self.vid_canvas_frame.figure.add_subplot(111)
+        self.vid_mean_line, = self.vid_frame_ax.plot([], [], 'b-', label='Mean', linewidth=2)
+        self.vid_std_line, = self.vid_frame_ax.plot([], [], 'r-', label='Std Dev', linewidth=2)
+        self.vid_frame_ax.set_title('Frame Statistics', fontsize=12)
+        self.vid_frame_ax.set_xlabel('Frame Number')
+        self.vid_frame_ax.set_ylabel('Pixel Value')
+        self.vid_frame_ax.legend()
+        self.vid_frame_ax.grid(True, alpha=0.2)
+
+        self.vid_motion_ax = self.vid_canvas_motion.figure.add_subplot(111)
+        self.vid_motion_line, = self.vid_motion_ax.plot([], [], 'g-', linewidth=2)
+        self.vid_motion_ax.set_title('Motion Analysis', fontsize=12)
+        self.vid_motion_ax.set_xlabel('Frame Number')
+        self.vid_motion_ax.set_ylabel('Motion Intensity')
+        self.vid_motion_ax.grid(True, alpha=0.2)
+
+        self.vid_lsb_ax = self.vid_canvas_lsb.figure.add_subplot(111)
+        self.vid_lsb_line, = self.vid_lsb_ax.plot([], [], 'purple', linewidth=2, marker='o', markersize=4)
+        self.vid_lsb_ax.axhline(y=0.5, color='red', linestyle='--', alpha=0.7, label='Expected (0.5)')
+        self.vid_lsb_ax.set_title('LSB Analysis Across Frames', fontsize=12)
+        self.vid_lsb_ax.set_xlabel('Frame Number')
+        self.vid_lsb_ax.set_ylabel('LSB Ratio')
+        self.vid_lsb_ax.set_ylim(0, 1)
+        self.vid_lsb_ax.legend()
+        self.vid_lsb_ax.grid(True, alpha=0.2)
+
     # ======== Export charts to PDF ========
 
+    def _chart_figures_for(self, file_ext: str) -> list:
+        """Return figures for the charts shown on screen for a file type"""
+        if file_ext in ['png', 'jpg', 'jpeg', 'bmp', 'gif']:
+            names = ('img_view_lsb', 'img_view_diff', 'img_canvas_hist')
+        elif file_ext in ['wav', 'mp3']:
+            names = ('aud_canvas_wave', 'aud_canvas_spec', 'aud_canvas_entropy')
+        elif file_ext in ['mp4', 'mov', 'avi']:
+            names = ('vid_canvas_frame', 'vid_canvas_motion', 'vid_canvas_lsb')
+        else:
+            names = ()
+        figures = []
+        for name in names:
+            # Charts of a tab that was never analyzed have not been built yet
+            chart = getattr(self, name, None)
+            if isinstance(chart, ChartImageView):
+                # Laid out once per analysis and reused by later exports
+                if chart.array is not None:
+                    figures.append(chart.export_figure())
+            elif chart is not None:
+                figures.append(chart.figure)
+        return figures
+
     def export_charts_pdf(self):
-        """Export currently displayed charts (image and/or audio) to a multi-page high-res PDF."""
+        """Export currently displayed charts (image, audio or video) to a multi-page PDF.
+
+        The figures are snapshotted on the GUI thread; the PDF itself is
+        rendered and written on a worker thread, so the window stays responsive.
+        """
         # Ask user where to save
         timestamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
         default_name = f"steganalysis_charts_{timestamp}.pdf"
@@ -2480,237 +1367,67 @@ class SteganalysisWindow(QMainWindow):
             return
 
         try:
-            with PdfPages(file_path) as pdf:
-                # Cover page with summary text
-                fig_cover = Figure(figsize=(8.27, 11.69),
-                                   dpi=200)  # A4 portrait
-                axc = fig_cover.subplots(1, 1)
-                axc.axis('off')
-                lines = []
-                # Basic summary details - show only the last analyzed file
-                if hasattr(self.machine, 'last_analyzed_path') and self.machine.last_analyzed_path:
-                    file_path = self.machine.last_analyzed_path
-                    file_ext = file_path.lower().split('.')[-1] if '.' in file_path else ''
-                    file_type = file_ext.upper()
-                    lines.append(f"{file_type}: {file_path}")
-                # Get confidence from the main machine (which delegates to specialized machines)
-                confidence = self.machine.get_confidence_level()
-                lines.append(f"Confidence: {confidence:.2%}")
-                y = 0.95
-                axc.text(0.05, y, "Steganalysis Charts", fontsize=16,
-                         weight='bold', transform=axc.transAxes)
-                y -= 0.05
-                for s in lines:
-                    axc.text(0.05, y, s, fontsize=10, transform=axc.transAxes)
-                    y -= 0.035
-                pdf.savefig(fig_cover, bbox_inches='tight')
-
-                # Determine file type and export only relevant charts
-                if hasattr(self.machine, 'last_analyzed_path') and self.machine.last_analyzed_path:
-                    file_ext = self.machine.last_analyzed_path.lower().split('.')[-1] if '.' in self.machine.last_analyzed_path else ''
-                    
-                    # Image charts: LSB + Diff side-by-side
-                    if file_ext in ['png', 'jpg', 'jpeg', 'bmp', 'gif'] and hasattr(self, 'img_canvas_lsb') and hasattr(self, 'img_canvas_diff'):
-                        fig_img = Figure(figsize=(11.69, 8.27),
-                                         dpi=200)  # A4 landscape
-                        ax1, ax2 = fig_img.subplots(1, 2)
-                        # Recompute from machine to ensure high-res
-                        img = self.machine.image_machine.image_array
-                        if img is not None:
-                            if img.dtype != np.uint8:
-                                img = img.astype(np.uint8)
-                            lsb = (img & 1)
-                            if lsb.ndim == 3:
-                                lsb_vis = (np.mean(lsb, axis=2)
-                                           * 255).astype(np.uint8)
-                            else:
-                                lsb_vis = (lsb * 255).astype(np.uint8)
-                            ax1.imshow(lsb_vis, cmap='gray')
-                            ax1.set_title('LSB Plane', fontsize=14)
-                            ax1.axis('off')
-                            blurred = cv2.GaussianBlur(img, (5, 5), 0)
-                            residual = cv2.absdiff(img, blurred)
-                            residual_gray = cv2.cvtColor(
-                                residual, cv2.COLOR_BGR2GRAY) if residual.ndim == 3 else residual
-                            ax2.imshow(residual_gray, cmap='inferno')
-                            ax2.set_title('Difference Map', fontsize=14)
-                            ax2.axis('off')
-                            pdf.savefig(fig_img, bbox_inches='tight')
-
-                        # Histogram page full width
-                        fig_hist = Figure(figsize=(11.69, 8.27), dpi=200)
-                        axh = fig_hist.subplots(1, 1)
-                        if img is not None:
-                            colors = ('r', 'g', 'b') if (
-                                img.ndim == 3 and img.shape[2] == 3) else ('k',)
-                            if len(colors) == 3:
-                                for i, c in enumerate(colors):
-                                    hist = cv2.calcHist([img], [i], None, [
-                                                        256], [0, 256]).flatten()
-                                    axh.plot(hist, color=c,
-                                             label=f'Channel {c.upper()}')
-                            else:
-                                hist, _ = np.histogram(
-                                    img.flatten(), bins=256, range=(0, 256))
-                                axh.plot(hist, color='k', label='Gray')
-                            axh.set_title('Histogram', fontsize=16)
-                            axh.set_xlabel('Pixel value', fontsize=12)
-                            axh.set_ylabel('Count', fontsize=12)
-                            axh.set_xlim(0, 255)
-                            axh.legend(loc='upper right', fontsize=10)
-                            axh.grid(True, alpha=0.2)
-                            pdf.savefig(fig_hist, bbox_inches='tight')
-
-                    # Audio charts: waveform + spectrogram + entropy
-                    elif file_ext in ['wav', 'mp3']:
-                        samples = getattr(self.machine.audio_machine, 'audio_samples', None)
-                        sr = getattr(self.machine.audio_machine, 'audio_sample_rate', None)
-                        if samples is not None and sr:
-                            if samples.ndim == 2:
-                                data = samples[:, 0].astype(np.float32)
-                            else:
-                                data = samples.astype(np.float32)
-
-                            # Waveform page
-                            fig_wave = Figure(figsize=(11.69, 8.27), dpi=200)
-                            axw = fig_wave.subplots(1, 1)
-                            t = np.arange(len(data)) / float(sr)
-                            axw.plot(t, data, color='#34495e', linewidth=0.7)
-                            axw.set_title('Waveform', fontsize=16)
-                            axw.set_xlabel('Time (s)', fontsize=12)
-                            axw.set_ylabel('Amplitude', fontsize=12)
-                            axw.grid(True, alpha=0.2)
-                            pdf.savefig(fig_wave, bbox_inches='tight')
-
-                            # Spectrogram page
-                            fig_spec = Figure(figsize=(11.69, 8.27), dpi=200)
-                            axs = fig_spec.subplots(1, 1)
-                            nfft = 1024
-                            noverlap = 512
-                            axs.specgram(data, NFFT=nfft, Fs=sr,
-                                         noverlap=noverlap, cmap='magma')
-                            axs.set_title('Spectrogram', fontsize=16)
-                            axs.set_xlabel('Time (s)', fontsize=12)
-                            axs.set_ylabel('Frequency (Hz)', fontsize=12)
-                            pdf.savefig(fig_spec, bbox_inches='tight')
-
-                            # Entropy page
-                            fig_ent = Figure(figsize=(11.69, 8.27), dpi=200)
-                            axe = fig_ent.subplots(1, 1)
-                            x = data - np.min(data)
-                            denom = (np.max(x) - np.min(x) + 1e-9)
-                            x = (x / denom * 255.0).astype(np.uint8)
-                            win = max(int(sr * 0.05), 256)
-                            hop = max(win // 2, 128)
-                            ent_values = []
-                            times = []
-                            for start in range(0, len(x) - win + 1, hop):
-                                seg = x[start:start + win]
-                                hist, _ = np.histogram(seg, bins=256, range=(0, 256))
-                                p = hist.astype(np.float32)
-                                p = p / max(np.sum(p), 1.0)
-                                p = p[p > 0]
-                                ent = float(-np.sum(p * np.log2(p)))
-                                ent_values.append(ent)
-                                times.append(start / float(sr))
-                            axe.plot(times, ent_values, color='#8e44ad', linewidth=1.0)
-                            axe.set_title('Short-time Entropy', fontsize=16)
-                            axe.set_xlabel('Time (s)', fontsize=12)
-                            axe.set_ylabel('Entropy (bits)', fontsize=12)
-                            axe.grid(True, alpha=0.2)
-                            pdf.savefig(fig_ent, bbox_inches='tight')
-
-                    # Video charts: frame analysis + motion analysis + LSB analysis
-                    elif file_ext in ['mp4', 'mov', 'avi']:
-                        frames = getattr(self.machine.video_machine, 'video_frames', None)
-                        if frames is not None and len(frames) > 0:
-                            # Sample frames for analysis (max 20 frames)
-                            sample_frames = frames[::max(1, len(frames)//20)]
-
-                            # Frame Statistics page
-                            fig_frame = Figure(figsize=(11.69, 8.27), dpi=200)
-                            ax_frame = fig_frame.subplots(1, 1)
-
-                            frame_stats = []
-                            for i, frame in enumerate(sample_frames):
-                                if frame.ndim == 3:
-                                    gray = cv2.cvtColor(frame, cv2.COLOR_RGB2GRAY)
-                                else:
-                                    gray = frame
-                                mean_val = np.mean(gray)
-                                std_val = np.std(gray)
-                                frame_stats.append((i, mean_val, std_val))
-
-                            frame_nums, means, stds = zip(*frame_stats)
-                            ax_frame.plot(frame_nums, means, 'b-',
-                                          label='Mean', linewidth=2)
-                            ax_frame.plot(frame_nums, stds, 'r-',
-                                          label='Std Dev', linewidth=2)
-                            ax_frame.set_title('Video Frame Statistics', fontsize=16)
-                            ax_frame.set_xlabel('Frame Number', fontsize=12)
-                            ax_frame.set_ylabel('Pixel Value', fontsize=12)
-                            ax_frame.legend()
-                            ax_frame.grid(True, alpha=0.2)
-                            pdf.savefig(fig_frame, bbox_inches='tight')
-
-                            # Motion Analysis page
-                            fig_motion = Figure(figsize=(11.69, 8.27), dpi=200)
-                            ax_motion = fig_motion.subplots(1, 1)
-
-                            motion_diffs = []
-                            for i in range(1, len(sample_frames)):
-                                diff = np.mean(np.abs(sample_frames[i].astype(np.float32) -
-                                                      sample_frames[i-1].astype(np.float32)))
-                                motion_diffs.append((i, diff))
-
-                            if motion_diffs:
-                                frame_nums, diffs = zip(*motion_diffs)
-                                ax_motion.plot(frame_nums, diffs, 'g-', linewidth=2)
-                                ax_motion.set_title(
-                                    'Video Motion Analysis', fontsize=16)
-                                ax_motion.set_xlabel('Frame Number', fontsize=12)
-                                ax_motion.set_ylabel('Motion Difference', fontsize=12)
-                                ax_motion.grid(True, alpha=0.2)
-                                pdf.savefig(fig_motion, bbox_inches='tight')
-
-                            # LSB Analysis page
-                            fig_lsb = Figure(figsize=(11.69, 8.27), dpi=200)
-                            ax_lsb = fig_lsb.subplots(1, 1)
-
-                            lsb_ratios = []
-                            for i, frame in enumerate(sample_frames):
-                                if frame.ndim == 3:
-                                    r = frame[:, :, 0]
-                                else:
-                                    r = frame
-                                lsb_ratio = np.mean(r & 1)
-                                lsb_ratios.append((i, lsb_ratio))
-
-                            frame_nums, ratios = zip(*lsb_ratios)
-                            ax_lsb.plot(frame_nums, ratios, 'm-', linewidth=2)
-                            ax_lsb.axhline(y=0.5, color='r',
-                                           linestyle='--', label='Expected (0.5)')
-                            ax_lsb.set_title('Video LSB Analysis', fontsize=16)
-                            ax_lsb.set_xlabel('Frame Number', fontsize=12)
-                            ax_lsb.set_ylabel('LSB Ratio', fontsize=12)
-                            ax_lsb.legend()
-                            ax_lsb.grid(True, alpha=0.2)
-                            pdf.savefig(fig_lsb, bbox_inches='tight')
-
-            # Notify success
-            if hasattr(self, 'img_results_text'):
-                self.img_results_text.append(
-                    f"Charts exported to PDF: {file_path}")
-            if hasattr(self, 'aud_results_text'):
-                self.aud_results_text.append(
-                    f"Charts exported to PDF: {file_path}")
-            if hasattr(self, 'vid_results_text'):
-                self.vid_results_text.append(
-                    f"Charts exported to PDF: {file_path}")
+            lines = []
+            file_ext = ''
+            # Basic summary details - show only the last analyzed file
+            if hasattr(self.machine, 'last_analyzed_path') and self.machine.last_analyzed_path:
+                analyzed_path = self.machine.last_analyzed_path
+                file_ext = analyzed_path.lower().split('.')[-1] if '.' in analyzed_path else ''
+                file_type = file_ext.upper()
+                lines.append(f"{file_type}: {analyzed_path}")
+            # Get confidence from the main machine (which delegates to specialized machines)
+            confidence = self.machine.get_confidence_level()
+            lines.append(f"Confidence: {confidence:.2%}")
+
+            # matplotlib is not thread-safe and the on-screen figures belong to
+            # Qt canvases, so the worker renders pickled copies of them
+            snapshots = [pickle.dumps(figure) for figure in self._chart_figures_for(file_ext)
+                         if figure.axes]
         except Exception as e:
-            if hasattr(self, 'img_results_text'):
-                self.img_results_text.append(f"Error exporting charts: {e}")
-            if hasattr(self, 'aud_results_text'):
-                self.aud_results_text.append(f"Error exporting charts: {e}")
-            if hasattr(self, 'vid_results_text'):
-                self.vid_results_text.append(f"Error exporting charts: {e}")
+            self._report_export(f"Error exporting charts: {e}")
+            return
+
+        self._export_worker = AnalysisWorker(self._write_charts_pdf, file_path, lines, snapshots)
+        self._export_worker.signals.finished.connect(
+            lambda path: self._report_export(f"Charts exported to PDF: {path}"))
+        self._export_worker.signals.error.connect(
+            lambda message: self._report_export(f"Error exporting charts: {message}"))
+        QThreadPool.globalInstance().start(self._export_worker)
+
+    @staticmethod
+    def _write_charts_pdf(file_path: str, lines: list, snapshots: list) -> str:
+        """Write a cover page and the pickled chart figures to a PDF (no widget access)"""
+        # Only needed when the user actually exports
+        from matplotlib.backends.backend_pdf import PdfPages
+        from matplotlib.figure import Figure
+
+        with PdfPages(file_path) as pdf:
+            # Cover page with summary text
+            fig_cover = Figure(figsize=(8.27, 11.69),
+                               dpi=100)  # A4 portrait
+            axc = fig_cover.subplots(1, 1)
+            axc.axis('off')
+            y = 0.95
+            axc.text(0.05, y, "Steganalysis Charts", fontsize=16,
+                     weight='bold', transform=axc.transAxes)
+            y -= 0.05
+            for s in lines:
+                axc.text(0.05, y, s, fontsize=10, transform=axc.transAxes)
+                y -= 0.035
+            pdf.savefig(fig_cover, bbox_inches='tight')
+
+            # The charts shown on screen for the analyzed file type, one page
+            # each, at the canvas resolution
+            for snapshot in snapshots:
+                figure = pickle.loads(snapshot)
+                pdf.savefig(figure, dpi=figure.dpi, bbox_inches='tight')
+        return file_path
+
+    def _report_export(self, message: str):
+        """Show an export outcome in every results pane"""
+        if hasattr(self, 'img_results_text'):
+            self.img_results_text.append(message)
+        if hasattr(self, 'aud_results_text'):
+            self.aud_results_text.append(message)
+        if hasattr(self, 'vid_results_text'):
+            self.vid_results_text.append(message)
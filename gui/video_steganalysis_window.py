@@ -1,86 +1,129 @@
 # gui/video_steganalysis_window.py
+import os
+from collections import OrderedDict
+from types import MappingProxyType
+
 import numpy as np
-import cv2
-from PIL import Image
-import io
 from PyQt6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QLabel, QPushButton, 
                              QFrame, QFileDialog, QTextEdit, QGroupBox, QGridLayout, 
                              QLineEdit, QComboBox, QProgressBar, QSizePolicy)
-from PyQt6.QtCore import Qt
-from PyQt6.QtGui import QFont, QPixmap
-from matplotlib.backends.backend_qtagg import FigureCanvasQTAgg as FigureCanvas
-from matplotlib.figure import Figure
+from PyQt6.QtCore import Qt, QThreadPool
+from PyQt6.QtGui import QFont, QPixmap, QImage
+
+from gui.workers import AnalysisWorker
 
 
 class VideoSteganalysisWindow(QWidget):
+    # Shared, read-only method help text shown under the method combo
+    METHOD_DESCRIPTIONS = MappingProxyType({
+        "Video LSB Analysis": "Analyzes least significant bits in video frames to detect hidden data embedded in video files.",
+        "Video Frame Analysis": "Examines individual video frames for anomalies and statistical irregularities that may indicate steganography.",
+        "Video Motion Analysis": "Analyzes motion vectors and temporal patterns between frames to detect hidden information.",
+        "Video Comprehensive Analysis": "Combines multiple video detection methods for thorough analysis of potential steganographic content.",
+        "Video Advanced Comprehensive": "Uses all available video analysis techniques for the most comprehensive steganalysis possible."
+    })
+
+    # Number of browse previews kept in memory
+    PREVIEW_CACHE_SIZE = 16
+
+    # Pixels per sampled frame read for the LSB ratio chart
+    LSB_SAMPLE_PIXELS = 200_000
+
     def __init__(self, machine):
         super().__init__()
         self.machine = machine
         self.main_gui = None  # Will be set by main window
+        self._worker = None
+        self._preview_worker = None
+        # Small LRU of rendered previews keyed by (path, mtime)
+        self._preview_cache = OrderedDict()
+        self._preview_key = None
         
     def set_main_gui(self, main_gui):
         """Set reference to main GUI for accessing widgets"""
         self.main_gui = main_gui
-        self.method_descriptions = {
-            "Video LSB Analysis": "Analyzes least significant bits in video frames to detect hidden data embedded in video files.",
-            "Video Frame Analysis": "Examines individual video frames for anomalies and statistical irregularities that may indicate steganography.",
-            "Video Motion Analysis": "Analyzes motion vectors and temporal patterns between frames to detect hidden information.",
-            "Video Comprehensive Analysis": "Combines multiple video detection methods for thorough analysis of potential steganographic content.",
-            "Video Advanced Comprehensive": "Uses all available video analysis techniques for the most comprehensive steganalysis possible."
-        }
+
+    @staticmethod
+    def _grab_frame_at(cap, index: int):
+        """Seek to a frame and decode only that one (grab + retrieve)"""
+        if index > 0:
+            import cv2
+            cap.set(cv2.CAP_PROP_POS_FRAMES, index)
+        if not cap.grab():
+            return False, None
+        return cap.retrieve()
 
     def create_video_preview(self, video_path: str):
-        """Create a frame preview of the selected video"""
+        """Create a frame preview of the selected video (decoded on a worker thread)"""
         try:
-            # Open video file
-            cap = cv2.VideoCapture(video_path)
-            success, frame = cap.read()
-            cap.release()
-
-            if not success or frame is None:
-                self.video_preview.setText("Error: Could not extract frame")
+            # Re-browsing an unchanged file reuses the pixmap rendered last time
+            key = (video_path, os.path.getmtime(video_path))
+            self._preview_key = key
+            pixmap = self._preview_cache.get(key)
+            if pixmap is not None:
+                self._preview_cache.move_to_end(key)
+                self._show_video_preview(pixmap)
                 return
 
-            # Convert BGR (OpenCV) → RGB (Qt/PIL)
-            frame_rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-
-            # Resize frame for preview while maintaining aspect ratio
-            img = Image.fromarray(frame_rgb)
-            
-            # Calculate new size maintaining aspect ratio, fitting within max height
-            max_width = 300
-            max_height = 180
-            
-            # Get original dimensions
-            original_width, original_height = img.size
-            
-            # Calculate scaling factor to fit within max dimensions
-            width_ratio = max_width / original_width
-            height_ratio = max_height / original_height
-            scale_factor = min(width_ratio, height_ratio)
-            
-            # Calculate new dimensions
-            new_width = int(original_width * scale_factor)
-            new_height = int(original_height * scale_factor)
-            
-            # Resize image
-            img = img.resize((new_width, new_height), Image.Resampling.LANCZOS)
-
-            # Convert to QPixmap
-            img_bytes = io.BytesIO()
-            img.save(img_bytes, format='PNG')
-            img_bytes.seek(0)
-
-            pixmap = QPixmap()
-            pixmap.loadFromData(img_bytes.getvalue())
-
-            # Set the preview
-            self.main_gui.video_preview.setPixmap(pixmap)
-            self.main_gui.video_preview.setText("")
+            self.main_gui.video_preview.setText("Loading preview...")
+            self._preview_worker = AnalysisWorker(self._load_frame_preview, video_path)
+            self._preview_worker.signals.finished.connect(
+                lambda image, key=key: self._on_video_preview_ready(key, image))
+            self._preview_worker.signals.error.connect(
+                lambda message, key=key: self._on_video_preview_error(key, message))
+            QThreadPool.globalInstance().start(self._preview_worker)
 
         except Exception as e:
             self.main_gui.video_preview.setText(f"Error loading video preview: {str(e)}")
 
+    def _on_video_preview_ready(self, key, image):
+        # Ignore a slower preview of a file the user has already browsed away from
+        if key != self._preview_key:
+            return
+        if image is None:
+            self.main_gui.video_preview.setText("Error: Could not extract frame")
+            return
+
+        pixmap = QPixmap.fromImage(image)
+        self._preview_cache[key] = pixmap
+        if len(self._preview_cache) > self.PREVIEW_CACHE_SIZE:
+            self._preview_cache.popitem(last=False)
+        self._show_video_preview(pixmap)
+
+    def _on_video_preview_error(self, key, message: str):
+        if key == self._preview_key:
+            self.main_gui.video_preview.setText(f"Error loading video preview: {message}")
+
+    def _show_video_preview(self, pixmap: QPixmap):
+        self.main_gui.video_preview.setPixmap(pixmap)
+        self.main_gui.video_preview.setText("")
+
+    @classmethod
+    def _load_frame_preview(cls, video_path: str):
+        """Decode the first frame and scale it to a preview QImage (no widget access)"""
+        # OpenCV is only needed once a video is actually opened
+        import cv2
+
+        # Open video file; the capture is released even if decoding raises
+        cap = cv2.VideoCapture(video_path)
+        try:
+            success, frame = cls._grab_frame_at(cap, 0)
+        finally:
+            cap.release()
+
+        if not success or frame is None:
+            return None
+
+        # Wrap the BGR frame as-is (Format_BGR888 needs no channel swap) and
+        # let Qt do the smooth downscale
+        max_width = 300
+        max_height = 180
+        height, width = frame.shape[:2]
+        image = QImage(frame.data, width, height, frame.strides[0], QImage.Format.Format_BGR888)
+        # scaled() returns a copy, so the preview no longer references frame
+        return image.scaled(max_width, max_height, Qt.AspectRatioMode.KeepAspectRatio,
+                            Qt.TransformationMode.SmoothTransformation)
+
     def browse_video(self):
         """Browse for video to analyze"""
         file_path, _ = QFileDialog.getOpenFileName(
@@ -98,18 +141,13 @@ class VideoSteganalysisWindow(QWidget):
                 if hasattr(self.main_gui, 'vid_results_text'):
                     self.main_gui.vid_results_text.append(f"Error loading video: {file_path}")
 
-    def on_video_method_changed(self):
-        """Handle video method dropdown change"""
-        method = self.main_gui.video_method_combo.currentText()
-        self.update_method_description(method, self.main_gui.video_method_description)
-
-    def update_method_description(self, method_name: str, description_widget: QLabel):
-        """Update the method description based on selected method"""
-        description = self.method_descriptions.get(method_name, "No description available for this method.")
-        description_widget.setText(description)
+    @classmethod
+    def describe_method(cls, method_name: str) -> str:
+        """Help text for a method; stored on the combo items when they are created"""
+        return cls.METHOD_DESCRIPTIONS.get(method_name, "No description available for this method.")
 
     def analyze_video(self):
-        """Analyze the selected video"""
+        """Analyze the selected video on a background worker"""
         if not self.main_gui.video_path.text():
             self.main_gui.vid_results_text.append("Error: Please select a video file to analyze")
             return
@@ -121,160 +159,185 @@ class VideoSteganalysisWindow(QWidget):
         # Show progress bar
         self.main_gui.vid_progress_bar.setVisible(True)
         self.main_gui.vid_progress_bar.setValue(0)
-        self.main_gui.vid_progress_bar.setFormat("Loading")
-        from PyQt6.QtWidgets import QApplication
-        QApplication.processEvents()
+        self.main_gui.vid_progress_bar.setFormat("Analyzing")
+        # The shared machine must not load another file or start a second
+        # analysis until this one has finished
+        self.main_gui.set_analysis_inputs_enabled(False)
 
-        # Load video into the machine
-        success = self.machine.set_video(self.main_gui.video_path.text())
-        if not success:
-            self.main_gui.vid_results_text.append("Error: Failed to load video for analysis")
-            self.main_gui.vid_progress_bar.setVisible(False)
-            return
-
-        # Set selected analysis method
+        # Read widget state here; the worker must not touch the GUI
+        video_path = self.main_gui.video_path.text()
         method = self.main_gui.video_method_combo.currentText()
-        
-        # Set sensitivity level from GUI
         sensitivity_level = self.main_gui.get_sensitivity_level("video")
+
+        self._worker = AnalysisWorker(self._run_video_analysis, video_path, method, sensitivity_level)
+        self._worker.signals.finished.connect(self._on_video_analysis_finished)
+        self._worker.signals.error.connect(self._on_video_analysis_error)
+        QThreadPool.globalInstance().start(self._worker)
+
+    def _run_video_analysis(self, video_path: str, method: str, sensitivity_level: str):
+        """Worker job: decode, run the analysis and prepare chart data (no widget access)"""
+        # Load video into the machine
+        if not self.machine.set_video(video_path):
+            return {"error": "Error: Failed to load video for analysis"}
+
         self.machine.set_sensitivity_level(sensitivity_level)
-        
-        # Run analysis
-        if self.machine.analyze_video(method):
-            results = self.machine.get_results()
-            stats = self.machine.get_video_statistics()
-            confidence = self.machine.get_confidence_level()
-
-            # === Results section ===
-            self.main_gui.vid_results_text.append("\n=== VIDEO ANALYSIS COMPLETE ===")
-            self.main_gui.vid_results_text.append(f"Method: {results.get('method')}")
-            self.main_gui.vid_results_text.append(f"Suspicious: {results.get('suspicious')}")
-            self.main_gui.vid_results_text.append(f"Confidence level: {confidence:.2%}\n")
-
-            # Helper function to pretty print nested dicts
-            def print_dict(d: dict, indent: int = 0):
-                for key, value in d.items():
-                    if isinstance(value, dict):
-                        self.main_gui.vid_results_text.append(" " * indent + f"{key}:")
-                        print_dict(value, indent + 4)
-                    else:
-                        self.main_gui.vid_results_text.append(" " * indent + f"- {key}: {value}")
-
-            # Print details (skip redundant top-level keys)
-            for key, value in results.items():
-                if key in ['method', 'suspicious']:
-                    continue
+        if not self.machine.analyze_video(method):
+            return {"error": "Error: Analysis failed"}
+
+        payload = {
+            "results": self.machine.get_results(),
+            "stats": self.machine.get_video_statistics(),
+            "confidence": self.machine.get_confidence_level(),
+        }
+        try:
+            frames = self.machine.video_frames
+            if frames is not None and len(frames) > 0:
+                payload["charts"] = self._compute_video_chart_data(frames)
+        except Exception as e:
+            payload["chart_error"] = str(e)
+        return payload
+
+    def _on_video_analysis_error(self, message: str):
+        """Report an exception raised inside the worker"""
+        self.main_gui.vid_results_text.append(f"Error: {message}")
+        self._finish_video_analysis()
+
+    def _finish_video_analysis(self):
+        self.main_gui.vid_progress_bar.setVisible(False)
+        self.main_gui.set_analysis_inputs_enabled(True)
+        self._worker = None
+
+    def _on_video_analysis_finished(self, payload: dict):
+        """Paint results, statistics and charts on the GUI thread"""
+        if "error" in payload:
+            self.main_gui.vid_results_text.append(payload["error"])
+            self._finish_video_analysis()
+            return
+
+        results = payload["results"]
+        stats = payload["stats"]
+        confidence = payload["confidence"]
+
+        # === Results section ===
+        # Lines are collected and appended once: every QTextEdit.append()
+        # re-lays out the document
+        lines = ["\n=== VIDEO ANALYSIS COMPLETE ===",
+                 f"Method: {results.get('method')}",
+                 f"Suspicious: {results.get('suspicious')}",
+                 f"Confidence level: {confidence:.2%}\n"]
+
+        # Helper function to pretty print nested dicts
+        def print_dict(d: dict, indent: int = 0):
+            for key, value in d.items():
                 if isinstance(value, dict):
-                    self.main_gui.vid_results_text.append(f"{key}:")
-                    print_dict(value, 4)
+                    lines.append(" " * indent + f"{key}:")
+                    print_dict(value, indent + 4)
                 else:
-                    self.main_gui.vid_results_text.append(f"{key}: {value}")
+                    lines.append(" " * indent + f"- {key}: {value}")
 
-            # === Stats section ===
-            self.main_gui.vid_stats_text.append("Video Statistics:")
-            for key, value in stats.items():
-                self.main_gui.vid_stats_text.append(f"- {key}: {value}")
+        # Print details (skip redundant top-level keys)
+        for key, value in results.items():
+            if key in ['method', 'suspicious']:
+                continue
+            if isinstance(value, dict):
+                lines.append(f"{key}:")
+                print_dict(value, 4)
+            else:
+                lines.append(f"{key}: {value}")
+        self.main_gui.vid_results_text.append("\n".join(lines))
+
+        # === Stats section ===
+        stats_lines = ["Video Statistics:"]
+        stats_lines.extend(f"- {key}: {value}" for key, value in stats.items())
+        self.main_gui.vid_stats_text.append("\n".join(stats_lines))
 
-            # === Charts ===
+        # === Charts ===
+        if "chart_error" in payload:
+            self.main_gui.vid_results_text.append(f"Chart error: {payload['chart_error']}")
+        elif "charts" in payload:
             try:
-                self._plot_video_charts()
+                self._plot_video_charts(payload["charts"])
             except Exception as e:
                 self.main_gui.vid_results_text.append(f"Chart error: {e}")
 
-        else:
-            self.main_gui.vid_results_text.append("Error: Analysis failed")
-
         # Hide progress bar
-        self.main_gui.vid_progress_bar.setVisible(False)
+        self._finish_video_analysis()
 
-    def _plot_video_charts(self):
-        """Render Frame Analysis, Motion Analysis, and LSB Analysis for the current video."""
-        frames = self.machine.video_frames
-        if frames is None or len(frames) == 0:
-            return
+    @staticmethod
+    def _rescale(ax):
+        """Fit an axes' autoscaled limits to its lines' current data"""
+        ax.relim()
+        ax.autoscale_view()
+
+    @classmethod
+    def _compute_video_chart_data(cls, frames) -> dict:
+        """Per-frame statistics for the video charts (pure numpy/cv2; no widget access)"""
+        import cv2
 
-        # Sample frames for analysis (max 20 frames)
+        # Sample frames for analysis (max 20 frames). Frames of one video share
+        # a size, so each sampled plane stacks into one (N, H*W) array and the
+        # statistics become row reductions instead of per-frame loops
         sample_frames = frames[::max(1, len(frames)//20)]
-        
+        if len(sample_frames) == 0:
+            empty = np.empty(0)
+            return {"means": empty, "stds": empty, "motion": empty, "lsb": empty}
+        if sample_frames[0].ndim == 3:
+            # cvtColor writes each frame straight into its slot of the stack
+            grays = np.empty((len(sample_frames),) + sample_frames[0].shape[:2], dtype=np.uint8)
+            for frame, gray in zip(sample_frames, grays):
+                cv2.cvtColor(frame, cv2.COLOR_RGB2GRAY, dst=gray)
+        else:
+            grays = np.stack(sample_frames)
+        grays = grays.reshape(len(grays), -1)
+
+        # The LSB ratio is a Bernoulli mean, so a fixed random subset of pixel
+        # positions estimates it to within ~0.001 without reading every pixel;
+        # sorted positions keep the gather moving forward through memory
+        n_pixels = grays.shape[1]
+        if n_pixels > cls.LSB_SAMPLE_PIXELS:
+            positions = np.sort(np.random.default_rng(0).choice(
+                n_pixels, cls.LSB_SAMPLE_PIXELS, replace=False))
+        else:
+            positions = slice(None)
+        # Use red channel for LSB analysis
+        reds = np.stack([frame.reshape(n_pixels, -1)[positions, 0] for frame in sample_frames])
+
+        # meanStdDev gets both in one pass per frame; np.std over the stack
+        # would build float64 temporaries of every sampled frame
+        means, stds = np.array([cv2.meanStdDev(gray) for gray in grays]).reshape(-1, 2).T
+
+        # Motion: mean absolute difference between consecutive sampled frames,
+        # kept in uint8 by absdiff rather than widened for a signed subtraction;
+        # a single sampled frame has no motion series
+        if len(grays) < 2:
+            motion = np.empty(0)
+        else:
+            motion = cv2.absdiff(grays[1:], grays[:-1]).mean(axis=1)
+        return {
+            "means": means,
+            "stds": stds,
+            "motion": motion,
+            "lsb": (reds & 1).mean(axis=1),
+        }
+
+    def _plot_video_charts(self, charts: dict):
+        """Render Frame Analysis, Motion Analysis, and LSB Analysis from precomputed chart data."""
+        self.main_gui.ensure_video_charts()
+        n = len(charts["means"])
+
         # Frame Analysis Chart
-        ax_frame = self.main_gui.vid_canvas_frame.figure.subplots(1, 1)
-        self.main_gui.vid_canvas_frame.figure.subplots_adjust(left=0.1, right=0.95, top=0.9, bottom=0.1)
-        ax_frame.clear()
-        
-        # Calculate frame statistics
-        frame_stats = []
-        for i, frame in enumerate(sample_frames):
-            if frame.ndim == 3:
-                gray = cv2.cvtColor(frame, cv2.COLOR_RGB2GRAY)
-            else:
-                gray = frame
-            mean_val = np.mean(gray)
-            std_val = np.std(gray)
-            frame_stats.append((i, mean_val, std_val))
-        
-        frame_nums, means, stds = zip(*frame_stats)
-        ax_frame.plot(frame_nums, means, 'b-', label='Mean', linewidth=2)
-        ax_frame.plot(frame_nums, stds, 'r-', label='Std Dev', linewidth=2)
-        ax_frame.set_title('Frame Statistics', fontsize=12)
-        ax_frame.set_xlabel('Frame Number')
-        ax_frame.set_ylabel('Pixel Value')
-        ax_frame.legend()
-        ax_frame.grid(True, alpha=0.2)
-        self.main_gui.vid_canvas_frame.draw()
+        self.main_gui.vid_mean_line.set_data(range(n), charts["means"])
+        self.main_gui.vid_std_line.set_data(range(n), charts["stds"])
+        self._rescale(self.main_gui.vid_frame_ax)
+        self.main_gui.vid_canvas_frame.draw_idle()
 
         # Motion Analysis Chart
-        ax_motion = self.main_gui.vid_canvas_motion.figure.subplots(1, 1)
-        self.main_gui.vid_canvas_motion.figure.subplots_adjust(left=0.1, right=0.95, top=0.9, bottom=0.1)
-        ax_motion.clear()
-        
-        # Calculate motion between consecutive frames
-        motion_values = []
-        for i in range(1, len(sample_frames)):
-            prev_frame = sample_frames[i-1]
-            curr_frame = sample_frames[i]
-            
-            if prev_frame.ndim == 3:
-                prev_gray = cv2.cvtColor(prev_frame, cv2.COLOR_RGB2GRAY)
-                curr_gray = cv2.cvtColor(curr_frame, cv2.COLOR_RGB2GRAY)
-            else:
-                prev_gray = prev_frame
-                curr_gray = curr_frame
-            
-            # Calculate frame difference
-            diff = cv2.absdiff(prev_gray, curr_gray)
-            motion = np.mean(diff)
-            motion_values.append(motion)
-        
-        ax_motion.plot(range(1, len(sample_frames)), motion_values, 'g-', linewidth=2)
-        ax_motion.set_title('Motion Analysis', fontsize=12)
-        ax_motion.set_xlabel('Frame Number')
-        ax_motion.set_ylabel('Motion Intensity')
-        ax_motion.grid(True, alpha=0.2)
-        self.main_gui.vid_canvas_motion.draw()
+        self.main_gui.vid_motion_line.set_data(range(1, n), charts["motion"])
+        self._rescale(self.main_gui.vid_motion_ax)
+        self.main_gui.vid_canvas_motion.draw_idle()
 
         # LSB Analysis Chart
-        ax_lsb = self.main_gui.vid_canvas_lsb.figure.subplots(1, 1)
-        self.main_gui.vid_canvas_lsb.figure.subplots_adjust(left=0.1, right=0.95, top=0.9, bottom=0.1)
-        ax_lsb.clear()
-        
-        # Calculate LSB ratios for each frame
-        lsb_ratios = []
-        for i, frame in enumerate(sample_frames):
-            if frame.ndim == 3:
-                # Use red channel for LSB analysis
-                r_channel = frame[:, :, 0]
-            else:
-                r_channel = frame
-            
-            lsb_ratio = np.mean(r_channel & 1)
-            lsb_ratios.append(lsb_ratio)
-        
-        ax_lsb.plot(range(len(sample_frames)), lsb_ratios, 'purple', linewidth=2, marker='o', markersize=4)
-        ax_lsb.axhline(y=0.5, color='red', linestyle='--', alpha=0.7, label='Expected (0.5)')
-        ax_lsb.set_title('LSB Analysis Across Frames', fontsize=12)
-        ax_lsb.set_xlabel('Frame Number')
-        ax_lsb.set_ylabel('LSB Ratio')
-        ax_lsb.set_ylim(0, 1)
-        ax_lsb.legend()
-        ax_lsb.grid(True, alpha=0.2)
-        self.main_gui.vid_canvas_lsb.draw()
+        self.main_gui.vid_lsb_line.set_data(range(n), charts["lsb"])
+        # The ratio axis stays fixed at 0..1; only the frame axis follows the data
+        self._rescale(self.main_gui.vid_lsb_ax)
+        self.main_gui.vid_canvas_lsb.draw_idle()
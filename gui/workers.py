@@ -0,0 +1,31 @@
+# gui/workers.py
+from PyQt6.QtCore import QObject, QRunnable, pyqtSignal
+
+
+class WorkerSignals(QObject):
+    """Signals emitted by an AnalysisWorker back to the GUI thread"""
+    finished = pyqtSignal(object)  # payload returned by the job
+    error = pyqtSignal(str)  # error message
+
+
+class AnalysisWorker(QRunnable):
+    """Run a steganalysis job on the global QThreadPool.
+
+    The job must not touch any widget; it returns plain Python/numpy data
+    which is delivered to the GUI thread through ``signals.finished``.
+    """
+
+    def __init__(self, fn, *args, **kwargs):
+        super().__init__()
+        self.fn = fn
+        self.args = args
+        self.kwargs = kwargs
+        self.signals = WorkerSignals()
+
+    def run(self):
+        try:
+            result = self.fn(*self.args, **self.kwargs)
+        except Exception as e:
+            self.signals.error.emit(str(e))
+        else:
+            self.signals.finished.emit(result)
@@ -5,9 +5,9 @@ from typing import Optional, Dict, List, Tuple
 import numpy as np
 import wave
 import contextlib
+import struct
 import scipy.fft
-from scipy import stats
-from scipy.signal import welch
+from scipy.special import xlogy
 import math
 
 
@@ -100,23 +100,40 @@ class AudioSteganalysisMachine:
                 print("Error: Only .wav PCM files are supported for audio steganalysis")
                 return False
 
+            # Only the header is parsed here; the sample data is memory-mapped below
             with contextlib.closing(wave.open(audio_path, 'rb')) as wf:
                 self.audio_num_channels = wf.getnchannels()
                 self.audio_sample_width = wf.getsampwidth()  # bytes
                 self.audio_sample_rate = wf.getframerate()
                 self.audio_num_frames = wf.getnframes()
-                frames = wf.readframes(self.audio_num_frames)
 
-            # Convert bytes to numpy array depending on sample width
+            if self.audio_sample_width not in (1, 2):
+                print(f"Error: Unsupported sample width: {self.audio_sample_width} bytes")
+                return False
+
+            data_offset, data_size = self._find_wav_data_chunk(audio_path)
+            # Truncated or streamed WAVs declare more data (often 0xFFFFFFFF)
+            # than the file holds; only the frames actually present are mapped,
+            # as readframes() would have returned
+            data_size = max(0, min(data_size, os.path.getsize(audio_path) - data_offset))
+            frame_bytes = self.audio_sample_width * max(self.audio_num_channels, 1)
+            self.audio_num_frames = min(self.audio_num_frames, data_size // frame_bytes)
+            count = self.audio_num_frames * max(self.audio_num_channels, 1)
+
+            # Map the PCM payload straight from the page cache instead of
+            # copying it into a bytes object with readframes(). 16-bit samples
+            # stay backed by the mapping, which keeps the file open (and locked
+            # against rename/delete on Windows) until the samples are dropped,
+            # so the previous file's mapping is released before the new one
+            self.audio_samples = None
             if self.audio_sample_width == 1:
                 # 8-bit PCM is unsigned in WAV; convert to int16 centered
-                raw = np.frombuffer(frames, dtype=np.uint8)
+                raw = np.memmap(audio_path, dtype=np.uint8, mode='r',
+                                offset=data_offset, shape=(count,))
                 raw = raw.astype(np.int16) - 128
-            elif self.audio_sample_width == 2:
-                raw = np.frombuffer(frames, dtype=np.int16)
             else:
-                print(f"Error: Unsupported sample width: {self.audio_sample_width} bytes")
-                return False
+                raw = np.asarray(np.memmap(audio_path, dtype='<i2', mode='r',
+                                           offset=data_offset, shape=(count,)))
 
             # Reshape for channels
             if self.audio_num_channels and self.audio_num_channels > 1:
@@ -137,6 +154,29 @@ class AudioSteganalysisMachine:
             print(f"Error loading audio: {e}")
             return False
 
+    @staticmethod
+    def _find_wav_data_chunk(audio_path: str) -> Tuple[int, int]:
+        """
+        Locate the PCM payload of a RIFF/WAVE file
+
+        Returns:
+            Tuple[int, int]: (byte offset of the data chunk, size in bytes)
+        """
+        with open(audio_path, 'rb') as f:
+            header = f.read(12)
+            if len(header) < 12 or header[:4] != b'RIFF' or header[8:12] != b'WAVE':
+                raise wave.Error("file does not start with RIFF/WAVE id")
+            while True:
+                chunk_header = f.read(8)
+                if len(chunk_header) < 8:
+                    raise wave.Error("data chunk not found")
+                chunk_id = chunk_header[:4]
+                chunk_size = struct.unpack('<I', chunk_header[4:])[0]
+                if chunk_id == b'data':
+                    return f.tell(), chunk_size
+                # Chunks are word aligned
+                f.seek(chunk_size + (chunk_size & 1), 1)
+
     def validate_audio_inputs(self) -> Tuple[bool, str]:
         """
         Validate audio inputs before analysis
@@ -152,6 +192,20 @@ class AudioSteganalysisMachine:
 
         return True, "Inputs valid"
 
+    def _first_channel_float32(self) -> np.ndarray:
+        """
+        First channel of the loaded samples as float32.
+
+        The integer samples are kept for the bit-level methods (LSB,
+        chi-square); the spectral, autocorrelation and entropy kernels work on
+        this float32 copy, which halves memory traffic compared to float64 and
+        avoids int16 overflow in sums and differences.
+        """
+        samples = self.audio_samples
+        if samples.ndim == 2:
+            samples = samples[:, 0]
+        return samples.astype(np.float32)
+
     def analyze_audio(self, method: str = "Audio LSB Analysis") -> bool:
         """
         Perform steganalysis on the audio
@@ -214,11 +268,9 @@ class AudioSteganalysisMachine:
         samples = self.audio_samples
         if samples.ndim == 2:
             # For stereo, analyze each channel and overall
-            channel_lsbs = []
-            for ch in range(samples.shape[1]):
-                ch_data = samples[:, ch]
-                lsb_ratio = np.mean((ch_data & 1) != 0)
-                channel_lsbs.append(float(lsb_ratio))
+            # One pass over the interleaved samples counts set LSBs for every channel
+            lsb_counts = np.count_nonzero(samples & 1, axis=0)
+            channel_lsbs = [float(c) / max(samples.shape[0], 1) for c in lsb_counts]
             avg_lsb = float(np.mean(channel_lsbs))
             # More conservative threshold for audio LSB analysis
             channel_deviations = [abs(ratio - 0.5) for ratio in channel_lsbs]
@@ -246,7 +298,7 @@ class AudioSteganalysisMachine:
             
             print(f"Audio LSB Analysis completed in {execution_time*1000:.2f}ms")
         else:
-            lsb_ratio = float(np.mean((samples & 1) != 0))
+            lsb_ratio = np.count_nonzero(samples & 1) / max(samples.size, 1)
             deviation = abs(lsb_ratio - 0.5)
             # Configurable threshold for mono audio based on sensitivity level
             thresholds = self.get_sensitivity_thresholds()
@@ -276,8 +328,9 @@ class AudioSteganalysisMachine:
                 data = data.astype(np.int16)
             # Shift to non-negative index range [0, 65535]
             shifted = (data.astype(np.int32) + 32768)
-            # Use histogram with 256 bins over full range to keep it light
-            hist, _ = np.histogram(shifted, bins=256, range=(0, 65536))
+            # 256 equal bins over the full range; each bin is 256 values wide, so
+            # the bin index is the high byte and bincount needs no edge search
+            hist = np.bincount(shifted >> 8, minlength=256)
             expected = np.mean(hist)
             expected = expected if expected > 0 else 1.0
             chi2 = np.sum((hist - expected) ** 2 / expected)
@@ -330,12 +383,12 @@ class AudioSteganalysisMachine:
         """Perform spectral analysis on audio"""
         print("Performing Audio Spectral analysis...")
         
-        samples = self.audio_samples
-        if samples.ndim == 2:
-            # Use first channel for analysis
-            samples = samples[:, 0]
+        # Use first channel for analysis
+        samples = self._first_channel_float32()
         
-        # Compute power spectral density
+        # Compute power spectral density; scipy.signal is only imported when
+        # this method actually runs
+        from scipy.signal import welch
         freqs, psd = welch(samples, fs=self.audio_sample_rate, nperseg=1024)
         
         # Analyze spectral characteristics
@@ -368,13 +421,14 @@ class AudioSteganalysisMachine:
         """Perform autocorrelation analysis on audio"""
         print("Performing Audio Autocorrelation analysis...")
         
-        samples = self.audio_samples
-        if samples.ndim == 2:
-            samples = samples[:, 0]
+        samples = self._first_channel_float32()
         
-        # Compute autocorrelation
-        autocorr = np.correlate(samples, samples, mode='full')
-        autocorr = autocorr[autocorr.size // 2:]
+        # Compute autocorrelation via the FFT (Wiener-Khinchin), zero-padded
+        # to avoid circular wrap-around; O(n log n) instead of np.correlate's O(n^2)
+        n = samples.size
+        nfft = scipy.fft.next_fast_len(2 * n - 1, real=True)
+        spectrum = scipy.fft.rfft(samples, nfft)
+        autocorr = scipy.fft.irfft(spectrum * np.conj(spectrum), nfft)[:n]
         
         # Normalize
         autocorr = autocorr / autocorr[0]
@@ -407,20 +461,17 @@ class AudioSteganalysisMachine:
         """Perform entropy analysis on audio"""
         print("Performing Audio Entropy analysis...")
         
-        samples = self.audio_samples
-        if samples.ndim == 2:
-            samples = samples[:, 0]
+        samples = self._first_channel_float32()
         
         # Convert to 8-bit for entropy calculation
         samples_8bit = ((samples - samples.min()) / (samples.max() - samples.min() + 1e-10) * 255).astype(np.uint8)
         
         # Calculate histogram
-        hist, _ = np.histogram(samples_8bit, bins=256, range=(0, 256))
+        hist = np.bincount(samples_8bit, minlength=256)
         
-        # Calculate entropy
+        # Calculate entropy; xlogy is 0 for empty bins, so no masked copy is needed
         hist = hist / np.sum(hist)  # Normalize to probabilities
-        hist = hist[hist > 0]  # Remove zero probabilities
-        entropy = -np.sum(hist * np.log2(hist))
+        entropy = -xlogy(hist, hist).sum() / np.log(2)
         
         # Calculate maximum possible entropy (uniform distribution)
         max_entropy = np.log2(256)
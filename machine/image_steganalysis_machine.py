@@ -6,7 +6,6 @@ from PIL import Image
 import numpy as np
 import statistics
 import scipy.fft
-from scipy import stats
 
 
 class ImageSteganalysisMachine:
@@ -22,6 +21,18 @@ class ImageSteganalysisMachine:
         self.image: Optional[Image.Image] = None
         self.image_array: Optional[np.ndarray] = None
         self.sensitivity_level: str = "ultra"  # Default to ultra-sensitive
+
+        # Grayscale view shared by the DCT and wavelet analyses
+        self._gray_array: Optional[np.ndarray] = None
+        self._gray_source: Optional[np.ndarray] = None
+
+        # Per-channel pixel-value histograms shared by the chi-square and
+        # histogram analyses and the GUI histogram chart
+        self._channel_hists: Optional[List[np.ndarray]] = None
+        self._hist_source: Optional[np.ndarray] = None
+
+        # Scratch arrays reused across analyses, keyed by name
+        self._buffers: Dict[str, np.ndarray] = {}
         
         # Analysis results
         self.results: Dict = {}
@@ -181,15 +192,14 @@ class ImageSteganalysisMachine:
         start_time = time.time()
         print("Performing LSB analysis...")
 
-        # Extract LSBs from each color channel
-        r_channel = self.image_array[:, :, 0]
-        g_channel = self.image_array[:, :, 1]
-        b_channel = self.image_array[:, :, 2]
+        # Extract LSBs from all color channels into a reused buffer
+        lsb = np.bitwise_and(self.image_array, 1,
+                             out=self._scratch('lsb', self.image_array.shape, self.image_array.dtype))
 
         # Calculate LSB statistics
-        r_lsb = r_channel & 1
-        g_lsb = g_channel & 1
-        b_lsb = b_channel & 1
+        r_lsb = lsb[:, :, 0]
+        g_lsb = lsb[:, :, 1]
+        b_lsb = lsb[:, :, 2]
 
         # Calculate LSB distribution
         r_lsb_ratio = np.mean(r_lsb)
@@ -205,7 +215,7 @@ class ImageSteganalysisMachine:
         
         # Cross-channel LSB correlation analysis
         correlations = []
-        lsb_patterns = [r_lsb.flatten(), g_lsb.flatten(), b_lsb.flatten()]
+        lsb_patterns = [r_lsb.ravel(), g_lsb.ravel(), b_lsb.ravel()]
         
         for i in range(len(lsb_patterns)):
             for j in range(i+1, len(lsb_patterns)):
@@ -282,14 +292,12 @@ class ImageSteganalysisMachine:
         # This is a simplified implementation
         # In practice, you'd implement the full chi-square test
 
-        r_channel = self.image_array[:, :, 0]
-        g_channel = self.image_array[:, :, 1]
-        b_channel = self.image_array[:, :, 2]
+        r_hist, g_hist, b_hist = self.get_channel_histograms()[:3]
 
         # Calculate chi-square statistic for each channel
-        r_chi2 = self._calculate_chi_square(r_channel)
-        g_chi2 = self._calculate_chi_square(g_channel)
-        b_chi2 = self._calculate_chi_square(b_channel)
+        r_chi2 = self._calculate_chi_square(r_hist)
+        g_chi2 = self._calculate_chi_square(g_hist)
+        b_chi2 = self._calculate_chi_square(b_hist)
 
         avg_chi2 = (r_chi2 + g_chi2 + b_chi2) / 3
         # More conservative threshold for chi-square test
@@ -317,13 +325,10 @@ class ImageSteganalysisMachine:
         
         print(f"Chi-Square Test completed in {execution_time*1000:.2f}ms")
 
-    def _calculate_chi_square(self, channel: np.ndarray) -> float:
-        """Calculate chi-square statistic for a channel with proper statistical analysis"""
-        # Count pixel value frequencies
-        hist, _ = np.histogram(channel, bins=256, range=(0, 256))
-        
+    def _calculate_chi_square(self, hist: np.ndarray) -> float:
+        """Calculate chi-square statistic for a channel's 256-bin histogram with proper statistical analysis"""
         # Calculate expected frequency (uniform distribution)
-        total_pixels = len(channel.flatten())
+        total_pixels = int(hist.sum())
         expected = total_pixels / 256
         
         # Only use bins with sufficient expected frequency (avoid division by zero)
@@ -355,46 +360,23 @@ class ImageSteganalysisMachine:
 
         # Go through R, G, B channels
         for idx, color in enumerate(['R', 'G', 'B']):
-            channel = self.image_array[:, :, idx].astype(np.int32)
+            channel = self._scratch('rs_channel', self.image_array.shape[:2], np.int16)
+            channel[...] = self.image_array[:, :, idx]
 
-            # Helper: flip LSBs
-            def flip_lsb(block):
-                return block ^ 1
+            # Horizontal non-overlapping pairs over an even number of columns
+            # (the last column is never paired, matching the original scan)
+            height, width = channel.shape
+            n_cols = ((width - 1) // 2) * 2
+            left = channel[:, 0:n_cols:2]
+            right = channel[:, 1:n_cols:2]
 
-            # Helper: discriminant (smoothness measure)
-            def discriminant(block):
-                return np.sum(np.abs(np.diff(block)))
+            # Pair differences before and after flipping LSBs
+            diff_original = np.abs(right - left)
+            diff_flipped = np.abs((right ^ 1) - (left ^ 1))
 
-            regular, singular = 0, 0
-
-            # Vectorized RS analysis - much faster than nested loops
-            height, width = channel.shape
-            
-            # Process in chunks to avoid memory issues
-            chunk_size = min(1000, width)
-            
-            for start_col in range(0, width - 1, chunk_size):
-                end_col = min(start_col + chunk_size, width - 1)
-                chunk = channel[:, start_col:end_col]
-                
-                # Ensure even number of columns for pairs
-                if chunk.shape[1] % 2 == 1:
-                    chunk = chunk[:, :-1]
-                
-                if chunk.shape[1] == 0:
-                    continue
-                
-                # Reshape to pairs and calculate differences
-                pairs = chunk.reshape(chunk.shape[0], chunk.shape[1]//2, 2)
-                diff_original = np.abs(pairs[:, :, 1] - pairs[:, :, 0])
-                
-                # Flip LSBs and calculate differences
-                pairs_flipped = pairs ^ 1
-                diff_flipped = np.abs(pairs_flipped[:, :, 1] - pairs_flipped[:, :, 0])
-                
-                # Count regular and singular
-                regular += np.sum(diff_flipped > diff_original)
-                singular += np.sum(diff_flipped < diff_original)
+            # Count regular and singular
+            regular = int(np.count_nonzero(diff_flipped > diff_original))
+            singular = int(np.count_nonzero(diff_flipped < diff_original))
 
             total = max(regular + singular, 1)
             rs_ratio = regular / total
@@ -431,21 +413,12 @@ class ImageSteganalysisMachine:
         suspicious_flag = False
 
         for idx, color in enumerate(['R', 'G', 'B']):
-            channel = self.image_array[:, :, idx].astype(np.int32)
-
-            total_pairs = 0
-            equal_pairs = 0
-            different_pairs = 0
-
-            # Iterate over rows and check adjacent pixel pairs
-            for row in channel:
-                for i in range(0, len(row) - 1):
-                    p1, p2 = row[i], row[i + 1]
-                    total_pairs += 1
-                    if p1 == p2:
-                        equal_pairs += 1
-                    else:
-                        different_pairs += 1
+            channel = self.image_array[:, :, idx]
+
+            # Compare every pixel with its right-hand neighbour in one pass
+            total_pairs = int(channel.shape[0] * max(channel.shape[1] - 1, 0))
+            equal_pairs = int(np.count_nonzero(channel[:, 1:] == channel[:, :-1]))
+            different_pairs = total_pairs - equal_pairs
 
             # Calculate ratio (normalized)
             equal_ratio = equal_pairs / max(total_pairs, 1)
@@ -532,25 +505,54 @@ class ImageSteganalysisMachine:
         
         print(f"Comprehensive Analysis completed in {execution_time*1000:.2f}ms")
 
+    def _scratch(self, name: str, shape: Tuple[int, ...], dtype=np.uint8) -> np.ndarray:
+        """Return a reusable scratch array, reallocating only when the shape or dtype changes"""
+        buf = self._buffers.get(name)
+        if buf is None or buf.shape != shape or buf.dtype != dtype:
+            buf = np.empty(shape, dtype=dtype)
+            self._buffers[name] = buf
+        return buf
+
+    def get_channel_histograms(self) -> List[np.ndarray]:
+        """256-bin pixel-value counts per channel of the current image, computed once per image array"""
+        if self._hist_source is not self.image_array:
+            # calcHist reads the interleaved channels in place, several times
+            # faster than bincount over strided channel views
+            import cv2
+            img = self.image_array.astype(np.uint8, copy=False)
+            channels = img.shape[2] if img.ndim == 3 else 1
+            self._channel_hists = [
+                cv2.calcHist([img], [i], None, [256], [0, 256]).ravel().astype(np.int64)
+                for i in range(channels)
+            ]
+            self._hist_source = self.image_array
+        return self._channel_hists
+
+    def _get_grayscale(self) -> np.ndarray:
+        """Channel-mean grayscale of the current image, computed once per image array"""
+        if self._gray_source is not self.image_array:
+            if len(self.image_array.shape) == 3:
+                self._gray_array = np.mean(self.image_array, axis=2)
+            else:
+                self._gray_array = self.image_array
+            self._gray_source = self.image_array
+        return self._gray_array
+
     def _perform_dct_analysis(self):
         """Perform DCT (Discrete Cosine Transform) analysis"""
         print("Performing DCT analysis...")
         
         # Convert to grayscale for DCT analysis
-        if len(self.image_array.shape) == 3:
-            gray = np.mean(self.image_array, axis=2)
-        else:
-            gray = self.image_array
+        gray = self._get_grayscale()
             
-        # Apply DCT to 8x8 blocks
-        dct_coeffs = []
-        for i in range(0, gray.shape[0] - 8, 8):
-            for j in range(0, gray.shape[1] - 8, 8):
-                block = gray[i:i+8, j:j+8].astype(np.float32)
-                dct_block = scipy.fft.dctn(block, norm='ortho')
-                dct_coeffs.append(dct_block.flatten())
-        
-        dct_coeffs = np.array(dct_coeffs)
+        # Apply DCT to 8x8 blocks (same block grid as scanning
+        # range(0, size - 8, 8) on each axis), batched into one dctn call
+        n_rows = len(range(0, gray.shape[0] - 8, 8))
+        n_cols = len(range(0, gray.shape[1] - 8, 8))
+        blocks = gray[:n_rows * 8, :n_cols * 8].astype(np.float32)
+        blocks = blocks.reshape(n_rows, 8, n_cols, 8).swapaxes(1, 2).reshape(-1, 8, 8)
+        dct_coeffs = scipy.fft.dctn(blocks, axes=(1, 2), norm='ortho', workers=-1)
+        dct_coeffs = dct_coeffs.reshape(-1, 64)
         
         # Analyze high-frequency coefficients (potential stego indicators)
         hf_coeffs = dct_coeffs[:, 1:]  # Exclude DC component
@@ -572,10 +574,7 @@ class ImageSteganalysisMachine:
         print("Performing Wavelet analysis...")
         
         # Convert to grayscale
-        if len(self.image_array.shape) == 3:
-            gray = np.mean(self.image_array, axis=2)
-        else:
-            gray = self.image_array
+        gray = self._get_grayscale()
             
         # Simple wavelet-like analysis using differences
         # Horizontal differences
@@ -590,7 +589,7 @@ class ImageSteganalysisMachine:
         
         # Check for unusual energy distribution
         energy_ratio = h_energy / (v_energy + 1e-10)
-        suspicious = abs(energy_ratio - 1.0) > 0.3 or total_energy > np.percentile(gray.flatten(), 95)
+        suspicious = abs(energy_ratio - 1.0) > 0.3 or total_energy > np.percentile(gray.ravel(), 95)
         
         self.results = {
             'method': 'Wavelet Analysis',
@@ -604,22 +603,19 @@ class ImageSteganalysisMachine:
         """Perform detailed histogram analysis"""
         print("Performing Histogram analysis...")
         
-        r_channel = self.image_array[:, :, 0]
-        g_channel = self.image_array[:, :, 1]
-        b_channel = self.image_array[:, :, 2]
+        r_hist, g_hist, b_hist = self.get_channel_histograms()[:3]
         
         # Calculate histogram smoothness
-        def histogram_smoothness(channel):
-            hist, _ = np.histogram(channel, bins=256, range=(0, 256))
+        def histogram_smoothness(hist):
             # Calculate second derivative (smoothness measure)
             diff1 = np.diff(hist)
             diff2 = np.diff(diff1)
             smoothness = np.sum(np.abs(diff2))
             return smoothness
         
-        r_smooth = histogram_smoothness(r_channel)
-        g_smooth = histogram_smoothness(g_channel)
-        b_smooth = histogram_smoothness(b_channel)
+        r_smooth = histogram_smoothness(r_hist)
+        g_smooth = histogram_smoothness(g_hist)
+        b_smooth = histogram_smoothness(b_hist)
         
         # Check for unusual histogram patterns
         avg_smoothness = (r_smooth + g_smooth + b_smooth) / 3
@@ -795,4 +791,9 @@ class ImageSteganalysisMachine:
         """Clean up resources when machine is destroyed"""
         self.image = None
         self.image_array = None
+        self._gray_array = None
+        self._gray_source = None
+        self._channel_hists = None
+        self._hist_source = None
+        self._buffers.clear()
         print("ImageSteganalysisMachine cleaned up")
@@ -6,9 +6,6 @@ import numpy as np
 import statistics
 import wave
 import contextlib
-import scipy.fft
-from scipy import stats
-from scipy.signal import welch
 import math
 
 # Import specialized machines
@@ -297,6 +294,15 @@ class SteganalysisMachine:
         """
         return self.image_machine.get_statistics()
 
+    def get_channel_histograms(self) -> List[np.ndarray]:
+        """
+        Get the current image's per-channel 256-bin histograms
+
+        Returns:
+            List[np.ndarray]: Pixel-value counts per channel
+        """
+        return self.image_machine.get_channel_histograms()
+
     def get_audio_statistics(self) -> Dict:
         """
         Get audio statistics
@@ -0,0 +1,81 @@
+import numpy as np
+import pytest
+from matplotlib import mlab
+
+from gui.audio_steganalysis_window import AudioSteganalysisWindow
+from machine.audio_steganalysis_machine import AudioSteganalysisMachine
+
+
+SAMPLE_RATE = 8000
+
+
+@pytest.fixture
+def samples():
+    # Noise over a tone, so the autocorrelation has peaks to find
+    rng = np.random.default_rng(1234)
+    t = np.arange(4000)
+    tone = 6000 * np.sin(2 * np.pi * t / 40)
+    return (tone + rng.normal(0, 2000, t.size)).astype(np.int16)
+
+
+@pytest.fixture
+def machine(samples):
+    machine = AudioSteganalysisMachine()
+    machine.audio_samples = samples
+    return machine
+
+
+def test_autocorrelation_matches_reference_loop(machine, samples):
+    machine._perform_audio_autocorrelation_analysis()
+    x = samples.astype(np.float64)
+    autocorr = np.array([np.dot(x[:x.size - lag], x[lag:]) for lag in range(1001)])
+    autocorr /= autocorr[0]
+    peaks = [autocorr[i] for i in range(1, 1000)
+             if autocorr[i] > autocorr[i - 1] and autocorr[i] > autocorr[i + 1] and autocorr[i] > 0.1]
+    assert machine.results['max_autocorr_lag1'] == pytest.approx(autocorr[1], rel=1e-4)
+    assert machine.results['num_significant_peaks'] == len(peaks)
+    assert machine.results['avg_peak_strength'] == pytest.approx(np.mean(peaks), rel=1e-4)
+
+
+def test_entropy_matches_reference_loop(machine, samples):
+    machine._perform_audio_entropy_analysis()
+    x = samples.astype(np.float32)
+    samples_8bit = ((x - x.min()) / (x.max() - x.min() + 1e-10) * 255).astype(np.uint8)
+    counts = [0] * 256
+    for value in samples_8bit:
+        counts[value] += 1
+    entropy = -sum(c / x.size * np.log2(c / x.size) for c in counts if c)
+    assert machine.results['entropy'] == pytest.approx(entropy, rel=1e-9)
+
+
+@pytest.mark.parametrize('win, hop', [(300, 128), (256, 128), (200, 200)])
+def test_short_time_entropy_matches_reference_loop(win, hop):
+    x = np.random.default_rng(1234).integers(0, 256, size=3001, dtype=np.uint8)
+    expected = []
+    for start in range(0, len(x) - win + 1, hop):
+        counts = np.bincount(x[start:start + win], minlength=256)
+        p = counts[counts > 0] / win
+        expected.append(-np.sum(p * np.log2(p)))
+    np.testing.assert_allclose(AudioSteganalysisWindow._short_time_entropy(x, win, hop), expected, rtol=1e-12)
+
+
+def test_power_spectrogram_matches_mlab_specgram(samples):
+    data = samples.astype(np.float32)
+    Pxx, freqs, bins = AudioSteganalysisWindow._power_spectrogram(data, SAMPLE_RATE, nfft=1024, noverlap=512)
+    expected, expected_freqs, expected_bins = mlab.specgram(
+        data.astype(np.float64), NFFT=1024, Fs=SAMPLE_RATE, noverlap=512)
+    assert Pxx.shape == expected.shape
+    np.testing.assert_allclose(Pxx, expected, rtol=1e-4, atol=1e-6 * expected.max())
+    np.testing.assert_allclose(freqs, expected_freqs)
+    np.testing.assert_allclose(bins, expected_bins)
+
+
+def test_silent_audio_has_finite_spectrogram_limits(samples):
+    silent = AudioSteganalysisWindow._compute_audio_chart_data(np.zeros(4000, dtype=np.int16), SAMPLE_RATE)
+    assert np.isfinite(silent['spec_clim']).all()
+
+    # Silence before the signal: the -inf dB pixels are left out of the limits
+    padded = np.concatenate([np.zeros(4000, dtype=np.int16), samples])
+    charts = AudioSteganalysisWindow._compute_audio_chart_data(padded, SAMPLE_RATE)
+    finite = charts['spec_db'][np.isfinite(charts['spec_db'])]
+    assert charts['spec_clim'] == (finite.min(), finite.max())
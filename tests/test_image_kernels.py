@@ -0,0 +1,57 @@
+import numpy as np
+import pytest
+import scipy.fft
+
+from machine.image_steganalysis_machine import ImageSteganalysisMachine
+
+
+@pytest.fixture
+def machine():
+    machine = ImageSteganalysisMachine()
+    # Odd width, so the RS scan has to leave the last column unpaired
+    machine.image_array = np.random.default_rng(1234).integers(0, 256, size=(19, 37, 3), dtype=np.uint8)
+    return machine
+
+
+def test_rs_matches_reference_loop(machine):
+    machine._perform_rs_analysis()
+    for idx, color in enumerate(['R', 'G', 'B']):
+        channel = machine.image_array[:, :, idx].astype(int)
+        regular, singular = 0, 0
+        for row in channel:
+            for j in range(0, len(row) - 2, 2):
+                original = abs(row[j + 1] - row[j])
+                flipped = abs((row[j + 1] ^ 1) - (row[j] ^ 1))
+                regular += flipped > original
+                singular += flipped < original
+        result = machine.results['channels'][color]
+        assert result['regular_groups'] == regular
+        assert result['singular_groups'] == singular
+
+
+def test_sample_pairs_matches_reference_loop(machine):
+    machine._perform_sample_pairs_analysis()
+    for idx, color in enumerate(['R', 'G', 'B']):
+        channel = machine.image_array[:, :, idx]
+        total_pairs, equal_pairs = 0, 0
+        for row in channel:
+            for i in range(len(row) - 1):
+                total_pairs += 1
+                equal_pairs += row[i] == row[i + 1]
+        result = machine.results['channels'][color]
+        assert result['total_pairs'] == total_pairs
+        assert result['equal_pairs'] == equal_pairs
+        assert result['different_pairs'] == total_pairs - equal_pairs
+
+
+def test_dct_matches_reference_loop(machine):
+    machine._perform_dct_analysis()
+    gray = np.mean(machine.image_array, axis=2)
+    dct_coeffs = []
+    for i in range(0, gray.shape[0] - 8, 8):
+        for j in range(0, gray.shape[1] - 8, 8):
+            block = gray[i:i + 8, j:j + 8].astype(np.float32)
+            dct_coeffs.append(scipy.fft.dctn(block, norm='ortho').flatten())
+    hf_variance = np.var(np.array(dct_coeffs)[:, 1:], axis=1)
+    assert machine.results['dct_blocks_analyzed'] == len(dct_coeffs)
+    assert machine.results['avg_hf_variance'] == pytest.approx(np.mean(hf_variance), rel=1e-5)
@@ -0,0 +1,33 @@
+import cv2
+import numpy as np
+
+from gui.video_steganalysis_window import VideoSteganalysisWindow
+
+
+def random_frames(count):
+    return list(np.random.default_rng(1234).integers(0, 256, size=(count, 12, 16, 3), dtype=np.uint8))
+
+
+def test_no_frames_gives_empty_series():
+    charts = VideoSteganalysisWindow._compute_video_chart_data([])
+    for key in ('means', 'stds', 'motion', 'lsb'):
+        assert len(charts[key]) == 0
+
+
+def test_single_frame_has_stats_but_no_motion():
+    frames = random_frames(1)
+    charts = VideoSteganalysisWindow._compute_video_chart_data(frames)
+    assert len(charts['means']) == 1
+    assert len(charts['stds']) == 1
+    assert len(charts['lsb']) == 1
+    assert len(charts['motion']) == 0
+
+
+def test_stats_match_reference_loop():
+    frames = random_frames(5)
+    charts = VideoSteganalysisWindow._compute_video_chart_data(frames)
+    grays = [cv2.cvtColor(frame, cv2.COLOR_RGB2GRAY).astype(np.float64) for frame in frames]
+    np.testing.assert_allclose(charts['means'], [gray.mean() for gray in grays])
+    np.testing.assert_allclose(charts['stds'], [gray.std() for gray in grays])
+    np.testing.assert_allclose(charts['motion'], [np.abs(b - a).mean() for a, b in zip(grays, grays[1:])])
+    np.testing.assert_allclose(charts['lsb'], [(frame[:, :, 0] & 1).mean() for frame in frames])
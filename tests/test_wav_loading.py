@@ -0,0 +1,65 @@
+import wave
+
+import numpy as np
+import pytest
+
+from machine.audio_steganalysis_machine import AudioSteganalysisMachine
+
+
+def write_wav(path, samples, sample_width):
+    with wave.open(str(path), 'wb') as wf:
+        wf.setnchannels(samples.shape[1])
+        wf.setsampwidth(sample_width)
+        wf.setframerate(8000)
+        wf.writeframes(samples.tobytes())
+
+
+@pytest.fixture
+def stereo():
+    return np.random.default_rng(1234).integers(-32768, 32768, size=(1000, 2), dtype=np.int16)
+
+
+def test_full_wav_roundtrip(tmp_path, stereo):
+    path = tmp_path / 'full.wav'
+    write_wav(path, stereo, 2)
+    machine = AudioSteganalysisMachine()
+    assert machine.set_audio(str(path))
+    assert machine.audio_num_frames == 1000
+    np.testing.assert_array_equal(machine.audio_samples, stereo)
+
+
+def test_truncated_wav_maps_only_present_frames(tmp_path, stereo):
+    path = tmp_path / 'truncated.wav'
+    write_wav(path, stereo, 2)
+    # Cut the last 100 frames and half of the frame before them
+    data = path.read_bytes()
+    path.write_bytes(data[:-(100 * 4 + 2)])
+    machine = AudioSteganalysisMachine()
+    assert machine.set_audio(str(path))
+    assert machine.audio_num_frames == 899
+    np.testing.assert_array_equal(machine.audio_samples, stereo[:899])
+
+
+def test_streamed_wav_size_is_clamped_to_file(tmp_path, stereo):
+    path = tmp_path / 'streamed.wav'
+    write_wav(path, stereo, 2)
+    # Streaming writers leave the data chunk size at 0xFFFFFFFF
+    data = bytearray(path.read_bytes())
+    offset = data.index(b'data') + 4
+    data[offset:offset + 4] = b'\xff\xff\xff\xff'
+    path.write_bytes(bytes(data))
+    machine = AudioSteganalysisMachine()
+    assert machine.set_audio(str(path))
+    assert machine.audio_num_frames == 1000
+    np.testing.assert_array_equal(machine.audio_samples, stereo)
+
+
+def test_truncated_8bit_wav(tmp_path):
+    samples = np.random.default_rng(1234).integers(0, 256, size=(500, 1), dtype=np.uint8)
+    path = tmp_path / 'truncated8.wav'
+    write_wav(path, samples, 1)
+    path.write_bytes(path.read_bytes()[:-50])
+    machine = AudioSteganalysisMachine()
+    assert machine.set_audio(str(path))
+    assert machine.audio_num_frames == 450
+    np.testing.assert_array_equal(machine.audio_samples, samples[:450, 0].astype(np.int16) - 128)